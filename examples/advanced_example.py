@@ -2,311 +2,465 @@
 
 import asyncio
 import httpx
-import json
+import orjson
+import textwrap
 import time
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
+
+
+# Request headers for bodies pre-encoded with orjson
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Tool definitions shared by the agent configs below
+WEB_SEARCH_TOOL = {
+    "name": "web_search",
+    "description": "Perform a web search",
+    "function_name": "web_search",
+    "parameters": {
+        "query": {"type": "string", "description": "Search query"},
+        "num_results": {"type": "integer", "description": "Number of results", "default": 5}
+    },
+    "required_params": ["query"]
+}
+
+CALCULATE_TOOL = {
+    "name": "calculate",
+    "description": "Safely evaluate a mathematical expression",
+    "function_name": "calculate",
+    "parameters": {
+        "expression": {"type": "string", "description": "Mathematical expression"}
+    },
+    "required_params": ["expression"]
+}
+
+READ_FILE_TOOL = {
+    "name": "read_file",
+    "description": "Read content from a file",
+    "function_name": "read_file",
+    "parameters": {
+        "file_path": {"type": "string", "description": "Path to file"}
+    },
+    "required_params": ["file_path"]
+}
+
+WRITE_FILE_TOOL = {
+    "name": "write_file",
+    "description": "Write content to a file",
+    "function_name": "write_file",
+    "parameters": {
+        "file_path": {"type": "string", "description": "Path to file"},
+        "content": {"type": "string", "description": "Content to write"}
+    },
+    "required_params": ["file_path", "content"]
+}
+
+GET_TIME_TOOL = {
+    "name": "get_current_time",
+    "description": "Get the current date and time",
+    "function_name": "get_current_time",
+    "parameters": {},
+    "required_params": []
+}
+
+# Agent instructions and workflow prompts, dedented once at import time
+RESEARCH_INSTRUCTIONS = textwrap.dedent("""\
+    You are a research specialist. Your job is to:
+    1. Analyze research questions thoroughly
+    2. Use web search to gather relevant information
+    3. Provide comprehensive, well-structured research summaries
+    4. Always cite your sources and provide balanced perspectives""")
+
+ANALYSIS_INSTRUCTIONS = textwrap.dedent("""\
+    You are a data analyst. Your job is to:
+    1. Perform mathematical calculations and statistical analysis
+    2. Read and analyze data from files
+    3. Create summaries and insights from numerical data
+    4. Present findings in a clear, structured format""")
+
+REPORT_INSTRUCTIONS = textwrap.dedent("""\
+    You are a report generator. Your job is to:
+    1. Compile information from multiple sources
+    2. Create well-structured, professional reports
+    3. Include executive summaries and key findings
+    4. Format reports with proper sections and conclusions""")
+
+CONVERSATIONAL_INSTRUCTIONS = textwrap.dedent("""\
+    You are a helpful conversational assistant.
+    Remember the context of our conversation and refer back to previous topics when relevant.
+    Be engaging and maintain continuity across multiple interactions.""")
+
+RESEARCH_TASK_TEMPLATE = textwrap.dedent("""\
+    Please research the topic: "{topic}"
+
+    Your task:
+    1. Search for current information about this topic
+    2. Gather key facts, statistics, and recent developments
+    3. Save your research findings to a file called '{research_file}'
+    4. Provide a summary of what you found""")
+
+ANALYSIS_TASK_TEMPLATE = textwrap.dedent("""\
+    Please read the research data from '{research_file}' and perform analysis:
+
+    Your task:
+    1. Read the research data file
+    2. Extract any numerical data or statistics
+    3. Perform relevant calculations or analysis
+    4. Identify key trends or patterns
+    5. Provide analytical insights""")
+
+REPORT_TASK_TEMPLATE = textwrap.dedent("""\
+    Please create a comprehensive report about "{topic}":
+
+    Your task:
+    1. Read the research data from '{research_file}'
+    2. Draw out the key facts, figures and trends it contains
+    3. Create a well-structured report with:
+       - Executive Summary
+       - Key Findings
+       - Analysis and Insights
+       - Conclusions and Recommendations
+    4. Save the final report as '{report_file}'
+    5. Include the current date and time in the report""")
+
+# Agent configurations for the research workflow
+RESEARCH_AGENT_CONFIG = {
+    "config": {
+        "name": "Research Specialist",
+        "description": "An agent specialized in research and information gathering",
+        "instructions": RESEARCH_INSTRUCTIONS,
+        "model": {
+            "provider": "openai",
+            "model_name": "gpt-4",
+            "temperature": 0.3
+        },
+        "tools": [
+            WEB_SEARCH_TOOL,
+            WRITE_FILE_TOOL
+        ],
+        "max_iterations": 15
+    }
+}
+
+ANALYSIS_AGENT_CONFIG = {
+    "config": {
+        "name": "Data Analyst",
+        "description": "An agent specialized in data analysis and calculations",
+        "instructions": ANALYSIS_INSTRUCTIONS,
+        "model": {
+            "provider": "openai",
+            "model_name": "gpt-3.5-turbo",
+            "temperature": 0.2
+        },
+        "tools": [
+            CALCULATE_TOOL,
+            READ_FILE_TOOL
+        ],
+        "max_iterations": 10
+    }
+}
+
+REPORT_AGENT_CONFIG = {
+    "config": {
+        "name": "Report Generator",
+        "description": "An agent specialized in creating comprehensive reports",
+        "instructions": REPORT_INSTRUCTIONS,
+        "model": {
+            "provider": "openai",
+            "model_name": "gpt-4",
+            "temperature": 0.4
+        },
+        "tools": [
+            READ_FILE_TOOL,
+            WRITE_FILE_TOOL,
+            GET_TIME_TOOL
+        ],
+        "max_iterations": 8
+    }
+}
+
+WORKFLOW_AGENT_CONFIGS = [
+    ("Research Specialist", RESEARCH_AGENT_CONFIG),
+    ("Data Analyst", ANALYSIS_AGENT_CONFIG),
+    ("Report Generator", REPORT_AGENT_CONFIG)
+]
+
+# Agent configuration for the session management demo
+CONVERSATIONAL_AGENT_CONFIG = {
+    "config": {
+        "name": "Conversational Assistant",
+        "description": "An assistant that maintains conversation context",
+        "instructions": CONVERSATIONAL_INSTRUCTIONS,
+        "model": {
+            "provider": "openai",
+            "model_name": "gpt-3.5-turbo",
+            "temperature": 0.7
+        },
+        "tools": [
+            GET_TIME_TOOL
+        ],
+        "memory_enabled": True
+    }
+}
 
 
 class AdvancedAgentBuilderClient:
-    """Advanced client with monitoring and session management."""
+    """Advanced client with monitoring and session management.
+    
+    Use as an async context manager so that every request shares one
+    pooled keep-alive connection to the API server.
+    """
     
     def __init__(self, base_url: str = "http://localhost:8000"):
         self.base_url = base_url
         self.api_base = f"{base_url}/api/v1"
         self.agents: Dict[str, str] = {}  # name -> agent_id mapping
+        self._client: Optional[httpx.AsyncClient] = None
+        
+        # Agent-creation bodies never change, so encode them once up front
+        self._workflow_bodies: List[Tuple[str, bytes]] = [
+            (name, orjson.dumps(config)) for name, config in WORKFLOW_AGENT_CONFIGS
+        ]
+        self._conversational_body = orjson.dumps(CONVERSATIONAL_AGENT_CONFIG)
+    
+    async def __aenter__(self):
+        """Open the shared HTTP client."""
+        # The transport retries failed connection attempts, which is safe
+        # for every method since nothing reached the server yet.
+        transport = httpx.AsyncHTTPTransport(
+            retries=3,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+        )
+        self._client = httpx.AsyncClient(
+            base_url=self.api_base,
+            transport=transport,
+            timeout=httpx.Timeout(30.0, connect=5.0)
+        )
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the shared HTTP client."""
+        await self.aclose()
+    
+    async def aclose(self):
+        """Close the shared HTTP client if it is open."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     async def create_research_workflow(self):
         """Create a multi-agent research workflow."""
         print("=== Creating Research Workflow ===")
         
-        # 1. Research Agent
-        research_agent_config = {
-            "config": {
-                "name": "Research Specialist",
-                "description": "An agent specialized in research and information gathering",
-                "instructions": """You are a research specialist. Your job is to:
-                1. Analyze research questions thoroughly
-                2. Use web search to gather relevant information
-                3. Provide comprehensive, well-structured research summaries
-                4. Always cite your sources and provide balanced perspectives""",
-                "model": {
-                    "provider": "openai",
-                    "model_name": "gpt-4",
-                    "temperature": 0.3
-                },
-                "tools": [
-                    {
-                        "name": "web_search",
-                        "description": "Perform a web search",
-                        "function_name": "web_search",
-                        "parameters": {
-                            "query": {"type": "string", "description": "Search query"},
-                            "num_results": {"type": "integer", "description": "Number of results", "default": 5}
-                        },
-                        "required_params": ["query"]
-                    },
-                    {
-                        "name": "write_file",
-                        "description": "Write content to a file",
-                        "function_name": "write_file",
-                        "parameters": {
-                            "file_path": {"type": "string", "description": "Path to file"},
-                            "content": {"type": "string", "description": "Content to write"}
-                        },
-                        "required_params": ["file_path", "content"]
-                    }
-                ],
-                "max_iterations": 15
-            }
-        }
+        # Create all agents concurrently
+        responses = await asyncio.gather(
+            *[
+                self._client.post("/agents", content=body, headers=JSON_HEADERS)
+                for _, body in self._workflow_bodies
+            ],
+            return_exceptions=True
+        )
+        lines = []
+        for (name, _), response in zip(self._workflow_bodies, responses):
+            if isinstance(response, Exception):
+                lines.append(f"✗ Failed to create {name}: {response}")
+            elif response.status_code == 200:
+                agent_data = orjson.loads(response.content)
+                self.agents[name] = agent_data["agent_id"]
+                lines.append(f"✓ Created {name}: {agent_data['agent_id']}")
+            else:
+                lines.append(f"✗ Failed to create {name}: {response.text}")
+        print("\n".join(lines))
+    
+    async def execute_research_workflow(self, research_topic: str, file_suffix: str = ""):
+        """Execute the complete research workflow.
         
-        # 2. Analysis Agent
-        analysis_agent_config = {
-            "config": {
-                "name": "Data Analyst",
-                "description": "An agent specialized in data analysis and calculations",
-                "instructions": """You are a data analyst. Your job is to:
-                1. Perform mathematical calculations and statistical analysis
-                2. Read and analyze data from files
-                3. Create summaries and insights from numerical data
-                4. Present findings in a clear, structured format""",
-                "model": {
-                    "provider": "openai",
-                    "model_name": "gpt-3.5-turbo",
-                    "temperature": 0.2
-                },
-                "tools": [
-                    {
-                        "name": "calculate",
-                        "description": "Safely evaluate a mathematical expression",
-                        "function_name": "calculate",
-                        "parameters": {
-                            "expression": {"type": "string", "description": "Mathematical expression"}
-                        },
-                        "required_params": ["expression"]
-                    },
-                    {
-                        "name": "read_file",
-                        "description": "Read content from a file",
-                        "function_name": "read_file",
-                        "parameters": {
-                            "file_path": {"type": "string", "description": "Path to file"}
-                        },
-                        "required_params": ["file_path"]
-                    }
-                ],
-                "max_iterations": 10
-            }
-        }
+        Args:
+            research_topic: Topic to research
+            file_suffix: Suffix for the workflow's data and report file
+                names, so concurrent workflows do not share files
+        """
+        print(f"\n=== Executing Research Workflow: {research_topic} ===")
+        research_file = f"research_data{file_suffix}.txt"
+        report_file = f"final_report{file_suffix}.txt"
         
-        # 3. Report Generator Agent
-        report_agent_config = {
-            "config": {
-                "name": "Report Generator",
-                "description": "An agent specialized in creating comprehensive reports",
-                "instructions": """You are a report generator. Your job is to:
-                1. Compile information from multiple sources
-                2. Create well-structured, professional reports
-                3. Include executive summaries and key findings
-                4. Format reports with proper sections and conclusions""",
-                "model": {
-                    "provider": "openai",
-                    "model_name": "gpt-4",
-                    "temperature": 0.4
-                },
-                "tools": [
-                    {
-                        "name": "read_file",
-                        "description": "Read content from a file",
-                        "function_name": "read_file",
-                        "parameters": {
-                            "file_path": {"type": "string", "description": "Path to file"}
-                        },
-                        "required_params": ["file_path"]
-                    },
-                    {
-                        "name": "write_file",
-                        "description": "Write content to a file",
-                        "function_name": "write_file",
-                        "parameters": {
-                            "file_path": {"type": "string", "description": "Path to file"},
-                            "content": {"type": "string", "description": "Content to write"}
-                        },
-                        "required_params": ["file_path", "content"]
-                    },
-                    {
-                        "name": "get_current_time",
-                        "description": "Get the current date and time",
-                        "function_name": "get_current_time",
-                        "parameters": {},
-                        "required_params": []
-                    }
-                ],
-                "max_iterations": 8
-            }
-        }
+        # Step 1: Research
+        print("Step 1: Conducting research...")
+        research_response = await self._client.post("/agents/execute", content=orjson.dumps({
+            "agent_id": self.agents["Research Specialist"],
+            "input_message": RESEARCH_TASK_TEMPLATE.format(
+                topic=research_topic,
+                research_file=research_file
+            )
+        }), headers=JSON_HEADERS)
         
-        # Create all agents
-        async with httpx.AsyncClient() as client:
-            for name, config in [
-                ("Research Specialist", research_agent_config),
-                ("Data Analyst", analysis_agent_config),
-                ("Report Generator", report_agent_config)
-            ]:
-                response = await client.post(f"{self.api_base}/agents", json=config)
-                if response.status_code == 200:
-                    agent_data = response.json()
-                    self.agents[name] = agent_data["agent_id"]
-                    print(f"✓ Created {name}: {agent_data['agent_id']}")
-                else:
-                    print(f"✗ Failed to create {name}: {response.text}")
-    
-    async def execute_research_workflow(self, research_topic: str):
-        """Execute the complete research workflow."""
-        print(f"\n=== Executing Research Workflow: {research_topic} ===")
+        research = self._decode_result(research_response)
+        if research:
+            print(f"Research completed in {research['execution_time']:.2f}s")
+            print(f"Tools used: {len(research['tool_calls'])}")
+            print(f"Summary: {research['response'][:200]}...")
         
-        async with httpx.AsyncClient() as client:
-            # Step 1: Research
-            print("Step 1: Conducting research...")
-            research_response = await client.post(f"{self.api_base}/agents/execute", json={
-                "agent_id": self.agents["Research Specialist"],
-                "input_message": f"""Please research the topic: "{research_topic}"
-                
-                Your task:
-                1. Search for current information about this topic
-                2. Gather key facts, statistics, and recent developments
-                3. Save your research findings to a file called 'research_data.txt'
-                4. Provide a summary of what you found"""
-            })
-            
-            if research_response.status_code == 200:
-                result = research_response.json()
-                print(f"Research completed in {result['execution_time']:.2f}s")
-                print(f"Tools used: {len(result['tool_calls'])}")
-                print(f"Summary: {result['response'][:200]}...")
-            
-            # Step 2: Analysis
-            print("\nStep 2: Analyzing data...")
-            analysis_response = await client.post(f"{self.api_base}/agents/execute", json={
+        # Steps 2 and 3 only depend on the research file, so run them concurrently
+        print("\nStep 2: Analyzing data...")
+        print("Step 3: Generating final report...")
+        analysis_response, report_response = await asyncio.gather(
+            self._client.post("/agents/execute", content=orjson.dumps({
                 "agent_id": self.agents["Data Analyst"],
-                "input_message": """Please read the research data from 'research_data.txt' and perform analysis:
-                
-                Your task:
-                1. Read the research data file
-                2. Extract any numerical data or statistics
-                3. Perform relevant calculations or analysis
-                4. Identify key trends or patterns
-                5. Provide analytical insights"""
-            })
-            
-            if analysis_response.status_code == 200:
-                result = analysis_response.json()
-                print(f"Analysis completed in {result['execution_time']:.2f}s")
-                print(f"Analysis summary: {result['response'][:200]}...")
-            
-            # Step 3: Report Generation
-            print("\nStep 3: Generating final report...")
-            report_response = await client.post(f"{self.api_base}/agents/execute", json={
+                "input_message": ANALYSIS_TASK_TEMPLATE.format(research_file=research_file)
+            }), headers=JSON_HEADERS),
+            self._client.post("/agents/execute", content=orjson.dumps({
                 "agent_id": self.agents["Report Generator"],
-                "input_message": f"""Please create a comprehensive report about "{research_topic}":
-                
-                Your task:
-                1. Read the research data from 'research_data.txt'
-                2. Incorporate any analysis findings
-                3. Create a well-structured report with:
-                   - Executive Summary
-                   - Key Findings
-                   - Analysis and Insights
-                   - Conclusions and Recommendations
-                4. Save the final report as 'final_report.txt'
-                5. Include the current date and time in the report"""
-            })
-            
-            if report_response.status_code == 200:
-                result = report_response.json()
-                print(f"Report generated in {result['execution_time']:.2f}s")
-                print(f"Report summary: {result['response'][:200]}...")
-            
-            return {
-                "research": research_response.json() if research_response.status_code == 200 else None,
-                "analysis": analysis_response.json() if analysis_response.status_code == 200 else None,
-                "report": report_response.json() if report_response.status_code == 200 else None
-            }
+                "input_message": REPORT_TASK_TEMPLATE.format(
+                    topic=research_topic,
+                    research_file=research_file,
+                    report_file=report_file
+                )
+            }), headers=JSON_HEADERS)
+        )
+        
+        analysis = self._decode_result(analysis_response)
+        if analysis:
+            print(f"Analysis completed in {analysis['execution_time']:.2f}s")
+            print(f"Analysis summary: {analysis['response'][:200]}...")
+        
+        report = self._decode_result(report_response)
+        if report:
+            print(f"Report generated in {report['execution_time']:.2f}s")
+            print(f"Report summary: {report['response'][:200]}...")
+        
+        return {
+            "research": research,
+            "analysis": analysis,
+            "report": report
+        }
+    
+    @staticmethod
+    def _decode_result(response: httpx.Response) -> Optional[Dict[str, Any]]:
+        """Decode a successful execution response once, or return None."""
+        if response.status_code != 200:
+            return None
+        return orjson.loads(response.content)
+    
+    async def execute_research_workflow_batch(
+        self,
+        research_topics: List[str],
+        concurrency: int = 4
+    ) -> List[Dict[str, Any]]:
+        """Execute the research workflow for several topics at once.
+        
+        Stages stay sequential within a topic, but up to ``concurrency``
+        topics are pipelined at the same time so one topic's research can
+        overlap another topic's analysis or report generation. Each topic
+        uses its own data and report files, suffixed with its index.
+        
+        Args:
+            research_topics: Topics to run through the workflow
+            concurrency: Maximum number of topics in flight
+        
+        Returns:
+            Workflow results in the same order as ``research_topics``
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def run(index: int, topic: str) -> Tuple[int, Dict[str, Any]]:
+            async with semaphore:
+                return index, await self.execute_research_workflow(topic, f"_{index}")
+        
+        # Handle each topic as soon as it finishes rather than waiting on the slowest
+        results: List[Optional[Dict[str, Any]]] = [None] * len(research_topics)
+        tasks = [asyncio.create_task(run(i, topic)) for i, topic in enumerate(research_topics)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, result = await next_done
+                results[index] = result
+                print(f"✓ Workflow finished: {research_topics[index]}")
+        finally:
+            # If one topic failed, stop the rest and collect their outcomes so
+            # none keeps using the client or leaves an unretrieved exception
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return results
     
     async def monitor_agents(self):
         """Monitor agent performance and metrics."""
         print("\n=== Agent Performance Monitoring ===")
         
-        async with httpx.AsyncClient() as client:
-            # Get system metrics
-            system_response = await client.get(f"{self.api_base}/metrics/system")
-            if system_response.status_code == 200:
-                metrics = system_response.json()
-                print(f"System Metrics:")
-                print(f"  Total Agents: {metrics['total_agents']}")
-                print(f"  Total Executions: {metrics['total_executions']}")
-                print(f"  Success Rate: {metrics['system_success_rate']:.2%}")
-            
-            # Get individual agent metrics
-            for name, agent_id in self.agents.items():
-                agent_response = await client.get(f"{self.api_base}/metrics/agents/{agent_id}")
-                if agent_response.status_code == 200:
-                    metrics = agent_response.json()
-                    print(f"\n{name} Metrics:")
-                    print(f"  Executions: {metrics['total_executions']}")
-                    print(f"  Success Rate: {metrics['success_rate']:.2%}")
-                    print(f"  Avg Duration: {metrics['average_duration']:.2f}s")
-                    print(f"  Total Tokens: {metrics['total_tokens']}")
+        # Fetch system metrics and all agents' metrics in one bulk request, concurrently
+        system_response, agent_metrics = await asyncio.gather(
+            self._client.get("/metrics/system"),
+            self.get_all_agent_metrics(),
+            return_exceptions=True
+        )
+        
+        if isinstance(system_response, Exception):
+            print(f"✗ Failed to fetch system metrics: {system_response}")
+        elif system_response.status_code == 200:
+            metrics = orjson.loads(system_response.content)
+            print(
+                f"System Metrics:\n"
+                f"  Total Agents: {metrics['total_agents']}\n"
+                f"  Total Executions: {metrics['total_executions']}\n"
+                f"  Success Rate: {metrics['system_success_rate']:.2%}"
+            )
+        
+        if isinstance(agent_metrics, Exception):
+            print(f"\n✗ Failed to fetch agent metrics: {agent_metrics}")
+            return
+        
+        names = {agent_id: name for name, agent_id in self.agents.items()}
+        lines = []
+        for metrics in agent_metrics:
+            lines.append(
+                f"\n{names.get(metrics['agent_id'], metrics['agent_id'])} Metrics:\n"
+                f"  Executions: {metrics['total_executions']}\n"
+                f"  Success Rate: {metrics['success_rate']:.2%}\n"
+                f"  Avg Duration: {metrics['average_duration']:.2f}s\n"
+                f"  Total Tokens: {metrics['total_tokens']}"
+            )
+        if lines:
+            print("\n".join(lines))
+    
+    async def get_all_agent_metrics(self) -> List[Dict[str, Any]]:
+        """Fetch metrics for every agent created by this client in one request.
+        
+        Returns:
+            Metrics for each agent that has recorded executions
+        """
+        if not self.agents:
+            return []
+        response = await self._client.get(
+            "/metrics/agents", params={"ids": ",".join(self.agents.values())}
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
     
     async def cleanup(self):
         """Clean up created agents."""
         print("\n=== Cleaning Up ===")
         
-        async with httpx.AsyncClient() as client:
-            for name, agent_id in self.agents.items():
-                response = await client.delete(f"{self.api_base}/agents/{agent_id}")
-                if response.status_code == 200:
-                    print(f"✓ Deleted {name}")
-                else:
-                    print(f"✗ Failed to delete {name}")
+        names = list(self.agents.keys())
+        responses = await asyncio.gather(
+            *[self._client.delete(f"/agents/{agent_id}") for agent_id in self.agents.values()],
+            return_exceptions=True
+        )
+        for name, response in zip(names, responses):
+            if not isinstance(response, Exception) and response.status_code == 200:
+                print(f"✓ Deleted {name}")
+            else:
+                print(f"✗ Failed to delete {name}")
 
 
 async def demo_session_management():
     """Demonstrate session management and conversation continuity."""
     print("\n=== Session Management Demo ===")
     
-    client = AdvancedAgentBuilderClient()
-    
-    # Create a conversational agent
-    agent_config = {
-        "config": {
-            "name": "Conversational Assistant",
-            "description": "An assistant that maintains conversation context",
-            "instructions": """You are a helpful conversational assistant. 
-            Remember the context of our conversation and refer back to previous topics when relevant.
-            Be engaging and maintain continuity across multiple interactions.""",
-            "model": {
-                "provider": "openai",
-                "model_name": "gpt-3.5-turbo",
-                "temperature": 0.7
-            },
-            "tools": [
-                {
-                    "name": "get_current_time",
-                    "description": "Get the current date and time",
-                    "function_name": "get_current_time",
-                    "parameters": {},
-                    "required_params": []
-                }
-            ],
-            "memory_enabled": True
-        }
-    }
-    
-    async with httpx.AsyncClient() as client_http:
-        # Create agent
-        response = await client_http.post(f"{client.api_base}/agents", json=agent_config)
-        agent_data = response.json()
+    async with AdvancedAgentBuilderClient() as client:
+        # Create a conversational agent
+        response = await client._client.post(
+            "/agents", content=client._conversational_body, headers=JSON_HEADERS
+        )
+        agent_data = orjson.loads(response.content)
         agent_id = agent_data["agent_id"]
         
         # Start a conversation with session management
@@ -320,26 +474,25 @@ async def demo_session_management():
             "Based on our conversation, can you summarize the key points for my Japan trip?"
         ]
         
+        # Turns share a session, so they must stay ordered; each turn is
+        # sent as soon as the previous response arrives.
         for i, message in enumerate(conversations, 1):
             print(f"\n--- Conversation Turn {i} ---")
             print(f"User: {message}")
             
-            response = await client_http.post(f"{client.api_base}/agents/execute", json={
+            response = await client._client.post("/agents/execute", content=orjson.dumps({
                 "agent_id": agent_id,
                 "input_message": message,
                 "session_id": session_id
-            })
+            }), headers=JSON_HEADERS)
             
             if response.status_code == 200:
-                result = response.json()
+                result = orjson.loads(response.content)
                 print(f"Assistant: {result['response']}")
                 print(f"(Execution time: {result['execution_time']:.2f}s)")
-            
-            # Small delay between messages
-            await asyncio.sleep(1)
         
         # Cleanup
-        await client_http.delete(f"{client.api_base}/agents/{agent_id}")
+        await client._client.delete(f"/agents/{agent_id}")
 
 
 async def main():
@@ -347,54 +500,64 @@ async def main():
     print("LangGraph Agent Builder System - Advanced Examples")
     print("=" * 60)
     
-    # Check server availability
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get("http://localhost:8000/api/v1/health")
-            if response.status_code != 200:
-                print("✗ Server is not responding correctly")
-                return
-    except Exception:
-        print("✗ Server is not running. Please start it with: python -m src.main")
-        return
-    
-    print("✓ Server is running")
-    
-    # Initialize client
-    client = AdvancedAgentBuilderClient()
-    
-    try:
-        # Demo 1: Multi-agent research workflow
-        await client.create_research_workflow()
-        workflow_results = await client.execute_research_workflow(
-            "The impact of artificial intelligence on job markets in 2024"
-        )
+    async with AdvancedAgentBuilderClient() as client:
+        # Check server availability over the shared connection pool
+        try:
+            response = await client._client.get("/health")
+        except Exception:
+            print("✗ Server is not running. Please start it with: python -m src.main")
+            return
         
-        # Demo 2: Session management
-        await demo_session_management()
+        if response.status_code != 200:
+            print("✗ Server is not responding correctly")
+            return
         
-        # Demo 3: Monitoring
-        await client.monitor_agents()
+        print("✓ Server is running")
         
-        print("\n" + "=" * 60)
-        print("Advanced examples completed successfully!")
+        try:
+            # Demo 1: Multi-agent research workflow
+            await client.create_research_workflow()
+            workflow_results = await client.execute_research_workflow(
+                "The impact of artificial intelligence on job markets in 2024"
+            )
         
-        # Show final summary
-        print("\nWorkflow Summary:")
-        if workflow_results["research"]:
-            print(f"✓ Research: {workflow_results['research']['status']}")
-        if workflow_results["analysis"]:
-            print(f"✓ Analysis: {workflow_results['analysis']['status']}")
-        if workflow_results["report"]:
-            print(f"✓ Report: {workflow_results['report']['status']}")
+            # Demo 2: Several topics through the same workflow concurrently
+            await client.execute_research_workflow_batch([
+                "Renewable energy adoption trends in 2024",
+                "The state of quantum computing in 2024"
+            ])
         
-    except Exception as e:
-        print(f"Error during execution: {e}")
-    
-    finally:
-        # Cleanup
-        await client.cleanup()
+            # Demo 3: Session management
+            await demo_session_management()
+        
+            # Demo 4: Monitoring
+            await client.monitor_agents()
+        
+            print("\n" + "=" * 60)
+            print("Advanced examples completed successfully!")
+        
+            # Show final summary
+            print("\nWorkflow Summary:")
+            if workflow_results["research"]:
+                print(f"✓ Research: {workflow_results['research']['status']}")
+            if workflow_results["analysis"]:
+                print(f"✓ Analysis: {workflow_results['analysis']['status']}")
+            if workflow_results["report"]:
+                print(f"✓ Report: {workflow_results['report']['status']}")
+        
+        except Exception as e:
+            print(f"Error during execution: {e}")
+        
+        finally:
+            # Cleanup
+            await client.cleanup()
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    # uvloop ships with uvicorn[standard]; fall back to the stock loop without it
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main()) 
\ No newline at end of file
@@ -2,21 +2,199 @@
 
 import asyncio
 import httpx
-import json
-from typing import Dict, Any
+import orjson
+import textwrap
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+
+# Request headers for bodies pre-encoded with orjson
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Tool definitions shared by the example agent configs
+CALCULATE_TOOL = {
+    "name": "calculate",
+    "description": "Safely evaluate a mathematical expression",
+    "function_name": "calculate",
+    "parameters": {
+        "expression": {
+            "type": "string",
+            "description": "Mathematical expression to evaluate"
+        }
+    },
+    "required_params": ["expression"]
+}
+
+GET_TIME_TOOL = {
+    "name": "get_current_time",
+    "description": "Get the current date and time",
+    "function_name": "get_current_time",
+    "parameters": {},
+    "required_params": []
+}
+
+WEB_SEARCH_TOOL = {
+    "name": "web_search",
+    "description": "Perform a web search",
+    "function_name": "web_search",
+    "parameters": {
+        "query": {
+            "type": "string",
+            "description": "Search query"
+        }
+    },
+    "required_params": ["query"]
+}
+
+READ_FILE_TOOL = {
+    "name": "read_file",
+    "description": "Read content from a file",
+    "function_name": "read_file",
+    "parameters": {
+        "file_path": {
+            "type": "string",
+            "description": "Path to the file to read"
+        }
+    },
+    "required_params": ["file_path"]
+}
+
+WRITE_FILE_TOOL = {
+    "name": "write_file",
+    "description": "Write content to a file",
+    "function_name": "write_file",
+    "parameters": {
+        "file_path": {
+            "type": "string",
+            "description": "Path to the file to write"
+        },
+        "content": {
+            "type": "string",
+            "description": "Content to write to the file"
+        }
+    },
+    "required_params": ["file_path", "content"]
+}
+
+# Agent instructions, dedented once at import time
+MULTI_TOOL_INSTRUCTIONS = textwrap.dedent("""\
+    You are a helpful assistant with access to various tools.
+    Use the appropriate tools to help answer questions. For math problems, use the calculator.
+    For time-related questions, use the get_current_time tool.""")
+
+RESEARCH_ASSISTANT_INSTRUCTIONS = textwrap.dedent("""\
+    You are a knowledgeable research assistant.
+    Help users with research questions, provide detailed explanations,
+    and offer insights on various topics.""")
+
+FILE_OPERATIONS_INSTRUCTIONS = textwrap.dedent("""\
+    You are a helpful assistant that can work with files.
+    You can read files, write files, and help users manage their documents.
+    Always be careful with file operations and ask for confirmation when needed.""")
 
 
 class AgentBuilderClient:
-    """Client for interacting with the LangGraph Agent Builder API."""
+    """Client for interacting with the LangGraph Agent Builder API.
+    
+    Use as an async context manager so that every request shares one
+    pooled keep-alive connection to the API server.
+    """
     
-    def __init__(self, base_url: str = "http://localhost:8000"):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        cache_ttl: float = 60.0,
+        exec_cache_size: int = 128
+    ):
         """Initialize the client.
         
         Args:
             base_url: Base URL of the API server
+            cache_ttl: Seconds to cache the tool and model listings
+            exec_cache_size: Maximum number of execution results to keep
         """
         self.base_url = base_url
         self.api_base = f"{base_url}/api/v1"
+        self.cache_ttl = cache_ttl
+        self.exec_cache_size = exec_cache_size
+        self._client: Optional[httpx.AsyncClient] = None
+        self._cache: Dict[str, Tuple[Any, float]] = {}
+        self._cache_lock = asyncio.Lock()
+        self._exec_cache: "OrderedDict[Tuple[str, str, Optional[str]], asyncio.Future]" = OrderedDict()
+    
+    async def __aenter__(self):
+        """Open the shared HTTP client."""
+        # The transport retries failed connection attempts, which is safe
+        # for every method since nothing reached the server yet.
+        transport = httpx.AsyncHTTPTransport(
+            retries=3,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+        )
+        self._client = httpx.AsyncClient(
+            base_url=self.api_base,
+            transport=transport,
+            timeout=httpx.Timeout(30.0, connect=5.0)
+        )
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the shared HTTP client."""
+        await self.aclose()
+    
+    async def aclose(self):
+        """Close the shared HTTP client if it is open."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    async def _request(self, method: str, path: str, body: Optional[Any] = None) -> Any:
+        """Send a request and decode its JSON response.
+        
+        Args:
+            method: HTTP method
+            path: Path relative to the API base URL
+            body: JSON-serializable request body, if any
+            
+        Returns:
+            Decoded response body
+            
+        Raises:
+            httpx.HTTPStatusError: If the server returns an error status
+        """
+        if body is None:
+            response = await self._client.request(method, path)
+        else:
+            response = await self._client.request(
+                method, path, content=orjson.dumps(body), headers=JSON_HEADERS
+            )
+        if response.status_code >= 400:
+            response.raise_for_status()
+        return orjson.loads(response.content)
+    
+    async def _cached_get(self, path: str) -> Any:
+        """GET a rarely-changing resource, caching it for ``cache_ttl`` seconds.
+        
+        Concurrent first hits share a single request.
+        
+        Args:
+            path: Path relative to the API base URL
+            
+        Returns:
+            Decoded response body
+        """
+        cached = self._cache.get(path)
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
+        
+        async with self._cache_lock:
+            cached = self._cache.get(path)
+            if cached and cached[1] > time.monotonic():
+                return cached[0]
+            value = await self._request("GET", path)
+            self._cache[path] = (value, time.monotonic() + self.cache_ttl)
+            return value
     
     async def create_agent(self, agent_config: Dict[str, Any]) -> Dict[str, str]:
         """Create a new agent.
@@ -27,34 +205,71 @@ class AgentBuilderClient:
         Returns:
             Agent creation response
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.api_base}/agents",
-                json=agent_config
-            )
-            response.raise_for_status()
-            return response.json()
+        return await self._request("POST", "/agents", agent_config)
     
-    async def execute_agent(self, agent_id: str, message: str) -> Dict[str, Any]:
+    async def execute_agent(
+        self,
+        agent_id: str,
+        message: str,
+        session_id: Optional[str] = None,
+        use_cache: bool = False
+    ) -> Dict[str, Any]:
         """Execute an agent with a message.
         
+        With ``use_cache``, identical (agent_id, message, session_id)
+        requests share one server round trip and in-flight duplicates await
+        the same result. Only completed executions are kept. Leave it off
+        when repeating a message in a session should run a new turn.
+        
         Args:
             agent_id: Agent ID
             message: Input message
+            session_id: Session ID for conversation continuity
+            use_cache: Whether to reuse a previous identical completed execution
             
         Returns:
             Agent execution response
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.api_base}/agents/execute",
-                json={
-                    "agent_id": agent_id,
-                    "input_message": message
-                }
-            )
-            response.raise_for_status()
-            return response.json()
+        if not use_cache:
+            return await self._execute(agent_id, message, session_id)
+        
+        key = (agent_id, message, session_id)
+        future = self._exec_cache.get(key)
+        if future is not None:
+            self._exec_cache.move_to_end(key)
+            return await asyncio.shield(future)
+        
+        future = asyncio.ensure_future(self._execute(agent_id, message, session_id))
+        self._exec_cache[key] = future
+        if len(self._exec_cache) > self.exec_cache_size:
+            self._exec_cache.popitem(last=False)
+        try:
+            result = await asyncio.shield(future)
+        except Exception:
+            # Don't cache failures
+            if self._exec_cache.get(key) is future:
+                del self._exec_cache[key]
+            raise
+        
+        # The server reports agent errors as a 200 with status "failed"
+        if result.get("status") != "completed" and self._exec_cache.get(key) is future:
+            del self._exec_cache[key]
+        return result
+    
+    async def _execute(
+        self,
+        agent_id: str,
+        message: str,
+        session_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Send an execution request to the server."""
+        body = {
+            "agent_id": agent_id,
+            "input_message": message
+        }
+        if session_id is not None:
+            body["session_id"] = session_id
+        return await self._request("POST", "/agents/execute", body)
     
     async def list_agents(self) -> list:
         """List all agents.
@@ -62,10 +277,7 @@ class AgentBuilderClient:
         Returns:
             List of agents
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{self.api_base}/agents")
-            response.raise_for_status()
-            return response.json()
+        return await self._request("GET", "/agents")
     
     async def get_available_tools(self) -> list:
         """Get available tools.
@@ -73,10 +285,7 @@ class AgentBuilderClient:
         Returns:
             List of available tools
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{self.api_base}/tools")
-            response.raise_for_status()
-            return response.json()
+        return await self._cached_get("/tools")
     
     async def get_supported_models(self) -> Dict[str, list]:
         """Get supported models.
@@ -84,18 +293,13 @@ class AgentBuilderClient:
         Returns:
             Dictionary of supported models by provider
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{self.api_base}/models")
-            response.raise_for_status()
-            return response.json()
+        return await self._cached_get("/models")
 
 
-async def example_1_simple_chat_agent():
+async def example_1_simple_chat_agent(client: AgentBuilderClient):
     """Example 1: Create a simple chat agent without tools."""
     print("=== Example 1: Simple Chat Agent ===")
     
-    client = AgentBuilderClient()
-    
     # Create a simple chat agent
     agent_config = {
         "config": {
@@ -132,12 +336,10 @@ async def example_1_simple_chat_agent():
         print(f"Error: {e}")
 
 
-async def example_2_agent_with_tools():
+async def example_2_agent_with_tools(client: AgentBuilderClient):
     """Example 2: Create an agent with built-in tools."""
     print("\n=== Example 2: Agent with Tools ===")
     
-    client = AgentBuilderClient()
-    
     # Get available tools
     available_tools = await client.get_available_tools()
     print(f"Available tools: {[tool['name'] for tool in available_tools]}")
@@ -147,34 +349,15 @@ async def example_2_agent_with_tools():
         "config": {
             "name": "Multi-Tool Assistant",
             "description": "An assistant that can perform calculations, get time, and search",
-            "instructions": """You are a helpful assistant with access to various tools. 
-            Use the appropriate tools to help answer questions. For math problems, use the calculator.
-            For time-related questions, use the get_current_time tool.""",
+            "instructions": MULTI_TOOL_INSTRUCTIONS,
             "model": {
                 "provider": "openai",
                 "model_name": "gpt-3.5-turbo",
                 "temperature": 0.3
             },
             "tools": [
-                {
-                    "name": "calculate",
-                    "description": "Safely evaluate a mathematical expression",
-                    "function_name": "calculate",
-                    "parameters": {
-                        "expression": {
-                            "type": "string",
-                            "description": "Mathematical expression to evaluate"
-                        }
-                    },
-                    "required_params": ["expression"]
-                },
-                {
-                    "name": "get_current_time",
-                    "description": "Get the current date and time",
-                    "function_name": "get_current_time",
-                    "parameters": {},
-                    "required_params": []
-                }
+                CALCULATE_TOOL,
+                GET_TIME_TOOL
             ],
             "max_iterations": 10
         }
@@ -201,38 +384,23 @@ async def example_2_agent_with_tools():
         print(f"Error: {e}")
 
 
-async def example_3_bedrock_agent():
+async def example_3_bedrock_agent(client: AgentBuilderClient):
     """Example 3: Create an agent using AWS Bedrock."""
     print("\n=== Example 3: AWS Bedrock Agent ===")
     
-    client = AgentBuilderClient()
-    
     # Create an agent using Bedrock
     agent_config = {
         "config": {
             "name": "Bedrock Research Assistant",
             "description": "A research assistant powered by AWS Bedrock",
-            "instructions": """You are a knowledgeable research assistant. 
-            Help users with research questions, provide detailed explanations, 
-            and offer insights on various topics.""",
+            "instructions": RESEARCH_ASSISTANT_INSTRUCTIONS,
             "model": {
                 "provider": "bedrock",
                 "model_name": "anthropic.claude-3-sonnet-20240229-v1:0",
                 "temperature": 0.5
             },
             "tools": [
-                {
-                    "name": "web_search",
-                    "description": "Perform a web search",
-                    "function_name": "web_search",
-                    "parameters": {
-                        "query": {
-                            "type": "string",
-                            "description": "Search query"
-                        }
-                    },
-                    "required_params": ["query"]
-                }
+                WEB_SEARCH_TOOL
             ],
             "max_iterations": 8
         }
@@ -257,54 +425,24 @@ async def example_3_bedrock_agent():
         print(f"Error: {e}")
 
 
-async def example_4_file_operations_agent():
+async def example_4_file_operations_agent(client: AgentBuilderClient):
     """Example 4: Create an agent that can work with files."""
     print("\n=== Example 4: File Operations Agent ===")
     
-    client = AgentBuilderClient()
-    
     # Create an agent with file operation tools
     agent_config = {
         "config": {
             "name": "File Operations Assistant",
             "description": "An assistant that can read and write files",
-            "instructions": """You are a helpful assistant that can work with files. 
-            You can read files, write files, and help users manage their documents.
-            Always be careful with file operations and ask for confirmation when needed.""",
+            "instructions": FILE_OPERATIONS_INSTRUCTIONS,
             "model": {
                 "provider": "openai",
                 "model_name": "gpt-3.5-turbo",
                 "temperature": 0.2
             },
             "tools": [
-                {
-                    "name": "read_file",
-                    "description": "Read content from a file",
-                    "function_name": "read_file",
-                    "parameters": {
-                        "file_path": {
-                            "type": "string",
-                            "description": "Path to the file to read"
-                        }
-                    },
-                    "required_params": ["file_path"]
-                },
-                {
-                    "name": "write_file",
-                    "description": "Write content to a file",
-                    "function_name": "write_file",
-                    "parameters": {
-                        "file_path": {
-                            "type": "string",
-                            "description": "Path to the file to write"
-                        },
-                        "content": {
-                            "type": "string",
-                            "description": "Content to write to the file"
-                        }
-                    },
-                    "required_params": ["file_path", "content"]
-                }
+                READ_FILE_TOOL,
+                WRITE_FILE_TOOL
             ],
             "max_iterations": 6
         }
@@ -341,29 +479,36 @@ async def main():
     print("LangGraph Agent Builder System - Examples")
     print("=" * 50)
     
-    # Check if server is running
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get("http://localhost:8000/api/v1/health")
-            if response.status_code == 200:
-                print("✓ Server is running")
-            else:
-                print("✗ Server is not responding correctly")
-                return
-    except Exception:
-        print("✗ Server is not running. Please start the server first with:")
-        print("  python -m src.main")
-        return
-    
-    # Run examples
-    await example_1_simple_chat_agent()
-    await example_2_agent_with_tools()
-    await example_3_bedrock_agent()
-    await example_4_file_operations_agent()
+    async with AgentBuilderClient() as client:
+        # Check if server is running, reusing the examples' connection pool
+        try:
+            response = await client._client.get("/health")
+        except Exception:
+            print("✗ Server is not running. Please start the server first with:")
+            print("  python -m src.main")
+            return
+        
+        if response.status_code == 200:
+            print("✓ Server is running")
+        else:
+            print("✗ Server is not responding correctly")
+            return
+        
+        # Run examples
+        await example_1_simple_chat_agent(client)
+        await example_2_agent_with_tools(client)
+        await example_3_bedrock_agent(client)
+        await example_4_file_operations_agent(client)
     
     print("\n" + "=" * 50)
     print("Examples completed!")
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    # uvloop ships with uvicorn[standard]; fall back to the stock loop without it
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main()) 
\ No newline at end of file
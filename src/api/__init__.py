@@ -1,5 +1,6 @@
 """API package for the LangGraph Agent Builder System."""
 
+from .responses import ORJSONResponse
 from .routes import router
 
-__all__ = ["router"] 
\ No newline at end of file
+__all__ = ["ORJSONResponse", "router"] 
\ No newline at end of file
@@ -0,0 +1,27 @@
+"""Response classes for the LangGraph Agent Builder API."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+def _default(obj: Any) -> Any:
+    """Serialize objects orjson does not handle natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+    
+    Handlers return it directly to skip FastAPI's ``jsonable_encoder`` pass;
+    orjson serializes datetimes, enums and nested pydantic models itself.
+    """
+    
+    media_type = "application/json"
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default)
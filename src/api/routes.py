@@ -1,31 +1,47 @@
 """FastAPI routes for the LangGraph Agent Builder System."""
 
-from typing import Dict, List, Any, Optional
+from datetime import datetime
+from typing import Dict, List, Optional
 from fastapi import APIRouter, HTTPException, Depends, status
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import PlainTextResponse, Response
+from pydantic import TypeAdapter
 
-from ..core import LangGraphAgentBuilder, ToolManager
+from .responses import ORJSONResponse
+
+from ..core import AgentNotFoundError, LangGraphAgentBuilder, ModelFactory, ToolManager
 from ..models import (
     AgentCreateRequest,
     AgentExecuteRequest,
     AgentResponse,
     Agent,
-    ToolConfig,
-    ModelProvider
+    ModelProvider,
+    ToolConfig
 )
-from ..monitoring import metrics_collector, PerformanceMonitor
-from ..config import get_settings
+from ..monitoring import PerformanceMonitor, get_metrics_collector
+from ..config import Settings, get_settings
 
 # Initialize router
+#
+# Handlers that call into the agent builder or the metrics collector do
+# blocking work (LLM round trips, graph compilation), so they are plain
+# ``def`` functions that FastAPI runs in its thread pool instead of on the
+# event loop.
 router = APIRouter()
 
 # Global agent builder instance
 agent_builder = LangGraphAgentBuilder()
 tool_manager = ToolManager()
 
+# Serializes tool lists to JSON bytes in a single pydantic-core call
+_tool_list_adapter = TypeAdapter(List[ToolConfig])
+
+# The tool and model catalogs only change on deploy, so let clients and
+# intermediaries reuse them briefly
+_STATIC_CACHE_HEADERS = {"Cache-Control": "public, max-age=60"}
+
 
 @router.post("/agents", response_model=Dict[str, str])
-async def create_agent(request: AgentCreateRequest):
+def create_agent(request: AgentCreateRequest):
     """Create a new agent.
     
     Args:
@@ -38,41 +54,47 @@ async def create_agent(request: AgentCreateRequest):
         agent_id = agent_builder.build_agent(request.config)
         
         # Update metrics
-        metrics_collector.update_active_agents(len(agent_builder.list_agents()))
+        get_metrics_collector().update_active_agents(agent_builder.count())
         
         return {
             "agent_id": agent_id,
             "status": "created",
             "message": f"Agent '{request.config.name}' created successfully"
         }
-    except Exception as e:
-        metrics_collector.record_error("agent_creation_failed", str(e))
+    except ValueError as e:
+        # Invalid model or agent configuration
+        get_metrics_collector().record_error("agent_creation_failed", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Failed to create agent: {str(e)}"
+            detail=f"Failed to create agent: {e}"
+        )
+    except Exception as e:
+        get_metrics_collector().record_error("agent_creation_failed", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create agent: {e}"
         )
 
 
-@router.get("/agents", response_model=List[Agent])
-async def list_agents():
+@router.get("/agents")
+def list_agents():
     """List all agents.
     
     Returns:
         List of all agents
     """
     try:
-        agents = agent_builder.list_agents()
-        return agents
+        return Response(content=agent_builder.list_agents_json(), media_type="application/json")
     except Exception as e:
-        metrics_collector.record_error("list_agents_failed", str(e))
+        get_metrics_collector().record_error("list_agents_failed", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to list agents: {str(e)}"
+            detail=f"Failed to list agents: {e}"
         )
 
 
 @router.get("/agents/{agent_id}", response_model=Agent)
-async def get_agent(agent_id: str):
+def get_agent(agent_id: str):
     """Get agent by ID.
     
     Args:
@@ -88,19 +110,20 @@ async def get_agent(agent_id: str):
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Agent {agent_id} not found"
             )
-        return agent_info["agent"]
+        # Reuse the entry's cached JSON encoding
+        return Response(content=agent_info.to_json(), media_type="application/json")
     except HTTPException:
         raise
     except Exception as e:
-        metrics_collector.record_error("get_agent_failed", str(e))
+        get_metrics_collector().record_error("get_agent_failed", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get agent: {str(e)}"
+            detail=f"Failed to get agent: {e}"
         )
 
 
 @router.delete("/agents/{agent_id}")
-async def delete_agent(agent_id: str):
+def delete_agent(agent_id: str):
     """Delete an agent.
     
     Args:
@@ -118,21 +141,21 @@ async def delete_agent(agent_id: str):
             )
         
         # Update metrics
-        metrics_collector.update_active_agents(len(agent_builder.list_agents()))
+        get_metrics_collector().update_active_agents(agent_builder.count())
         
         return {"message": f"Agent {agent_id} deleted successfully"}
     except HTTPException:
         raise
     except Exception as e:
-        metrics_collector.record_error("delete_agent_failed", str(e))
+        get_metrics_collector().record_error("delete_agent_failed", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to delete agent: {str(e)}"
+            detail=f"Failed to delete agent: {e}"
         )
 
 
-@router.post("/agents/execute", response_model=Dict[str, Any])
-async def execute_agent(request: AgentExecuteRequest):
+@router.post("/agents/execute", response_class=ORJSONResponse)
+def execute_agent(request: AgentExecuteRequest):
     """Execute an agent with input.
     
     Args:
@@ -142,7 +165,7 @@ async def execute_agent(request: AgentExecuteRequest):
         Agent execution result
     """
     try:
-        with PerformanceMonitor(metrics_collector, request.agent_id) as monitor:
+        with PerformanceMonitor(get_metrics_collector(), request.agent_id) as monitor:
             result = agent_builder.execute_agent(
                 agent_id=request.agent_id,
                 input_message=request.input_message,
@@ -160,23 +183,23 @@ async def execute_agent(request: AgentExecuteRequest):
             
             monitor.set_status(result["status"])
             
-            return result
+            return ORJSONResponse(result)
             
-    except ValueError as e:
+    except AgentNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         )
     except Exception as e:
-        metrics_collector.record_error("agent_execution_failed", str(e))
+        get_metrics_collector().record_error("agent_execution_failed", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to execute agent: {str(e)}"
+            detail=f"Failed to execute agent: {e}"
         )
 
 
-@router.get("/tools", response_model=List[ToolConfig])
-async def list_available_tools():
+@router.get("/tools")
+def list_available_tools():
     """List all available tools.
     
     Returns:
@@ -184,36 +207,73 @@ async def list_available_tools():
     """
     try:
         tools = tool_manager.get_available_tools()
-        return tools
+        return Response(
+            content=_tool_list_adapter.dump_json(tools),
+            media_type="application/json",
+            headers=_STATIC_CACHE_HEADERS
+        )
     except Exception as e:
-        metrics_collector.record_error("list_tools_failed", str(e))
+        get_metrics_collector().record_error("list_tools_failed", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to list tools: {str(e)}"
+            detail=f"Failed to list tools: {e}"
         )
 
 
-@router.get("/models", response_model=Dict[str, List[str]])
-async def list_supported_models():
+@router.get("/models", response_model=Dict[str, List[str]], response_class=ORJSONResponse)
+def list_supported_models():
     """List all supported models by provider.
     
     Returns:
         Dictionary of supported models by provider
     """
     try:
-        from ..core.model_factory import ModelFactory
-        models = ModelFactory.get_supported_models()
-        return {provider.value: model_list for provider, model_list in models.items()}
+        return ORJSONResponse(
+            ModelFactory.get_supported_models_by_value(),
+            headers=_STATIC_CACHE_HEADERS
+        )
     except Exception as e:
-        metrics_collector.record_error("list_models_failed", str(e))
+        get_metrics_collector().record_error("list_models_failed", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to list models: {str(e)}"
+            detail=f"Failed to list models: {e}"
         )
 
 
-@router.get("/metrics/agents/{agent_id}")
-async def get_agent_metrics(agent_id: str):
+@router.get("/metrics/agents", response_class=ORJSONResponse)
+def list_agent_metrics(ids: Optional[str] = None):
+    """Get metrics for several agents in one request.
+    
+    Args:
+        ids: Comma-separated agent IDs; all registered agents if omitted
+        
+    Returns:
+        List of agent metrics, skipping agents without recorded executions
+    """
+    try:
+        if ids is None:
+            # Failed calls for unknown or deleted agents are recorded too,
+            # so list only agents that currently exist
+            agent_ids = [agent.id for agent in agent_builder.list_agents()]
+        else:
+            agent_ids = [agent_id for agent_id in ids.split(",") if agent_id]
+        
+        results = []
+        for agent_id in agent_ids:
+            metrics = get_metrics_collector().get_agent_metrics(agent_id)
+            if metrics:
+                results.append(metrics)
+        return ORJSONResponse(results)
+    except Exception as e:
+        get_metrics_collector().record_error("list_agent_metrics_failed", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to list agent metrics: {e}"
+        )
+
+
+@router.get("/metrics/agents/{agent_id}", response_class=ORJSONResponse)
+def get_agent_metrics(agent_id: str):
     """Get metrics for a specific agent.
     
     Args:
@@ -223,71 +283,77 @@ async def get_agent_metrics(agent_id: str):
         Agent metrics
     """
     try:
-        metrics = metrics_collector.get_agent_metrics(agent_id)
+        metrics = get_metrics_collector().get_agent_metrics(agent_id)
         if not metrics:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"No metrics found for agent {agent_id}"
             )
-        return metrics
+        return ORJSONResponse(metrics)
     except HTTPException:
         raise
     except Exception as e:
-        metrics_collector.record_error("get_agent_metrics_failed", str(e))
+        get_metrics_collector().record_error("get_agent_metrics_failed", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get agent metrics: {str(e)}"
+            detail=f"Failed to get agent metrics: {e}"
         )
 
 
 @router.get("/metrics/system")
-async def get_system_metrics():
+def get_system_metrics():
     """Get system-wide metrics.
     
     Returns:
         System metrics
     """
     try:
-        metrics = metrics_collector.get_system_metrics()
-        return metrics
+        return Response(content=get_metrics_collector().get_system_metrics_json(), media_type="application/json")
     except Exception as e:
-        metrics_collector.record_error("get_system_metrics_failed", str(e))
+        get_metrics_collector().record_error("get_system_metrics_failed", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to get system metrics: {str(e)}"
+            detail=f"Failed to get system metrics: {e}"
         )
 
 
 @router.get("/metrics/prometheus", response_class=PlainTextResponse)
-async def get_prometheus_metrics():
+def get_prometheus_metrics():
     """Get metrics in Prometheus format.
     
     Returns:
         Prometheus metrics as plain text
     """
+    # Deferred so importing the app does not load prometheus_client
+    from prometheus_client import CONTENT_TYPE_LATEST
+    
     try:
-        metrics = metrics_collector.export_prometheus_metrics()
-        return metrics
+        return Response(
+            content=get_metrics_collector().export_prometheus_bytes(),
+            media_type=CONTENT_TYPE_LATEST
+        )
     except Exception as e:
-        metrics_collector.record_error("export_prometheus_metrics_failed", str(e))
+        get_metrics_collector().record_error("export_prometheus_metrics_failed", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to export Prometheus metrics: {str(e)}"
+            detail=f"Failed to export Prometheus metrics: {e}"
         )
 
 
 @router.get("/health")
-async def health_check():
+async def health_check(settings: Settings = Depends(get_settings)):
     """Health check endpoint.
     
+    Args:
+        settings: Application settings
+        
     Returns:
         Health status
     """
-    settings = get_settings()
     return {
         "status": "healthy",
         "app_name": settings.app_name,
         "version": settings.app_version,
-        "active_agents": len(agent_builder.list_agents()),
-        "timestamp": metrics_collector.get_system_metrics()["timestamp"]
+        "active_agents": agent_builder.count(),
+        "timestamp": datetime.utcnow().isoformat()
     } 
\ No newline at end of file
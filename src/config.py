@@ -1,6 +1,7 @@
 """Configuration management for the LangGraph Agent Builder System."""
 
 import os
+from functools import lru_cache
 from typing import Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
@@ -41,6 +42,11 @@ class Settings(BaseSettings):
     # Server Configuration
     host: str = Field("0.0.0.0", env="HOST")
     port: int = Field(8000, env="PORT")
+    threadpool_size: int = Field(100, env="THREADPOOL_SIZE")
+    
+    # Tool Configuration
+    tool_io_buffer_size: int = Field(1024 * 1024, env="TOOL_IO_BUFFER_SIZE")
+    tool_pool_size: int = Field(32, env="TOOL_POOL_SIZE")
     
     model_config = {
         "env_file": ".env",
@@ -49,10 +55,10 @@ class Settings(BaseSettings):
     }
 
 
-# Global settings instance
-settings = Settings()
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get the application settings."""
-    return settings 
\ No newline at end of file
+    """Get the application settings.
+    
+    The settings are loaded from the environment on first use and cached.
+    """
+    return Settings() 
\ No newline at end of file
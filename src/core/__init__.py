@@ -1,12 +1,13 @@
 """Core package for the LangGraph Agent Builder System."""
 
-from .agent_builder import LangGraphAgentBuilder, AgentState
+from .agent_builder import LangGraphAgentBuilder, AgentState, AgentNotFoundError
 from .model_factory import ModelFactory
 from .tools import ToolManager, BuiltInTools
 
 __all__ = [
     "LangGraphAgentBuilder",
     "AgentState",
+    "AgentNotFoundError",
     "ModelFactory",
     "ToolManager",
     "BuiltInTools",
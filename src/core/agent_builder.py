@@ -1,12 +1,14 @@
 """Core LangGraph agent builder for dynamic agent creation."""
 
+import threading
+import time
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import Any, Callable, Dict, List, Optional, TypedDict
 from langgraph.graph import StateGraph, END
 from langgraph.prebuilt import ToolNode, create_react_agent
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, ToolMessage
-from langchain_core.tools import Tool
+from langchain_core.tools import BaseTool
 
 from .model_factory import ModelFactory
 from .tools import ToolManager
@@ -22,12 +24,74 @@ class AgentState(TypedDict):
     context: Dict[str, Any]
 
 
+class AgentNotFoundError(ValueError):
+    """Raised when an agent ID is not registered."""
+
+
+class AgentEntry:
+    """Registry entry holding a built agent and its runtime objects."""
+    
+    __slots__ = (
+        "agent",
+        "graph",
+        "llm",
+        "tools",
+        "system_message",
+        "system_message_msg",
+        "has_tools",
+        "initial_state_fn",
+        "serialized",
+        "lock",
+    )
+    
+    def __init__(
+        self,
+        agent: Agent,
+        graph: Any,
+        llm: Any,
+        tools: List[BaseTool],
+        system_message: str,
+        system_message_msg: HumanMessage,
+        initial_state_fn: Callable[[str, str, Optional[Dict[str, Any]]], Dict[str, Any]],
+        lock: Any
+    ):
+        self.agent = agent
+        self.graph = graph
+        self.llm = llm
+        self.tools = tools
+        self.system_message = system_message
+        self.system_message_msg = system_message_msg
+        self.has_tools = bool(tools)
+        self.initial_state_fn = initial_state_fn
+        # JSON encoding of ``agent``, rebuilt lazily after it changes
+        self.serialized: Optional[bytes] = None
+        # The builder's registry lock; ``agent`` is only mutated under it
+        self.lock = lock
+    
+    def to_json(self) -> bytes:
+        """Get the JSON encoding of the agent summary."""
+        serialized = self.serialized
+        if serialized is None:
+            # Encode and store under the lock so a concurrent update cannot
+            # clear the cache between the two and leave stale bytes behind
+            with self.lock:
+                serialized = self.serialized
+                if serialized is None:
+                    serialized = self.serialized = self.agent.model_dump_json().encode()
+        return serialized
+
+
 class LangGraphAgentBuilder:
     """Builder for creating LangGraph-based agents dynamically."""
     
     def __init__(self):
         self.tool_manager = ToolManager()
-        self.agents: Dict[str, Any] = {}
+        # Route handlers run in a thread pool, so registry writes go through
+        # a lock. Readers use single dict lookups, which are atomic.
+        self._lock = threading.RLock()
+        self._agents: Dict[str, AgentEntry] = {}
+        self._agent_summaries: Dict[str, Agent] = {}
+        self._count = 0
     
     def build_agent(self, config: AgentConfig) -> str:
         """Build a new LangGraph agent from configuration.
@@ -51,11 +115,12 @@ class LangGraphAgentBuilder:
         tools = self.tool_manager.create_tools_from_configs(config.tools)
         
         # Create system message with instructions
+        tool_names = str([tool.name for tool in tools]) if tools else "No tools available"
         system_message = f"""You are {config.name}. {config.description}
 
 {config.instructions}
 
-You have access to the following tools: {[tool.name for tool in tools] if tools else 'No tools available'}
+You have access to the following tools: {tool_names}
 
 Important guidelines:
 - Follow the instructions carefully
@@ -65,6 +130,9 @@ Important guidelines:
 - Maximum iterations allowed: {config.max_iterations}
 """
         
+        # The system prompt is fixed per agent, so build its message once
+        system_message_msg = HumanMessage(content=system_message)
+        
         # Build the agent using create_react_agent for simplicity and reliability
         if tools:
             # Use the prebuilt ReAct agent for tool-enabled agents
@@ -72,76 +140,134 @@ Important guidelines:
         else:
             # For agents without tools, create a simple graph
             workflow = StateGraph(AgentState)
-            workflow.add_node("agent", self._simple_agent_node(llm, system_message))
+            workflow.add_node("agent", self._simple_agent_node(llm, system_message_msg))
             workflow.set_entry_point("agent")
             workflow.add_edge("agent", END)
             agent_graph = workflow.compile()
         
         # Store agent information
+        now = datetime.utcnow()
         agent = Agent(
             id=agent_id,
             name=config.name,
             description=config.description,
             config=config,
             status=AgentStatus.CREATED,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+            created_at=now,
+            updated_at=now
         )
         
-        self.agents[agent_id] = {
-            "agent": agent,
-            "graph": agent_graph,
-            "llm": llm,
-            "tools": tools,
-            "system_message": system_message
-        }
+        with self._lock:
+            self._agents[agent_id] = AgentEntry(
+                agent=agent,
+                graph=agent_graph,
+                llm=llm,
+                tools=tools,
+                system_message=system_message,
+                system_message_msg=system_message_msg,
+                initial_state_fn=self._make_initial_state_fn(bool(tools)),
+                lock=self._lock
+            )
+            self._agent_summaries[agent_id] = agent
+            self._count += 1
         
         return agent_id
     
-    def _simple_agent_node(self, llm: Any, system_message: str):
+    def _simple_agent_node(self, llm: Any, system_message: HumanMessage):
         """Create a simple agent node for non-tool agents.
         
         Args:
             llm: Language model
-            system_message: System instructions
+            system_message: Prebuilt system instructions message
             
         Returns:
             Agent node function
         """
         def agent(state: AgentState) -> AgentState:
             # Prepare messages with system instructions
-            messages = [HumanMessage(content=system_message)] + state["messages"]
+            messages = [system_message, *state["messages"]]
             
             # Get response from LLM
             response = llm.invoke(messages)
             
-            # Update state
+            # Update state with a shallow copy rather than re-spreading every key
+            new_messages = list(state["messages"])
+            new_messages.append(response)
+            new_state = state.copy()
+            new_state["messages"] = new_messages
+            new_state["iteration_count"] += 1
+            return new_state
+        
+        return agent
+    
+    @staticmethod
+    def _make_initial_state_fn(has_tools: bool):
+        """Create the initial-state builder for an agent's graph type.
+        
+        Args:
+            has_tools: Whether the agent uses the prebuilt ReAct graph
+            
+        Returns:
+            Function taking (input_message, session_id, context) and
+            returning the graph's initial state
+        """
+        if has_tools:
+            # ReAct agent expects just messages
+            def react_state(input_message: str, session_id: str, context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+                return {"messages": [HumanMessage(content=input_message)]}
+            
+            return react_state
+        
+        # Custom agent uses our state structure
+        def custom_state(input_message: str, session_id: str, context: Optional[Dict[str, Any]]) -> AgentState:
             return {
-                **state,
-                "messages": state["messages"] + [response],
-                "iteration_count": state["iteration_count"] + 1
+                "messages": [HumanMessage(content=input_message)],
+                "iteration_count": 0,
+                "tool_calls": [],
+                "session_id": session_id,
+                "context": context if context is not None else {}
             }
         
-        return agent
+        return custom_state
     
-    def get_agent(self, agent_id: str) -> Optional[Dict[str, Any]]:
+    def get_agent(self, agent_id: str) -> Optional[AgentEntry]:
         """Get agent by ID.
         
         Args:
             agent_id: Agent ID
             
         Returns:
-            Agent information or None if not found
+            Agent entry or None if not found
         """
-        return self.agents.get(agent_id)
+        return self._agents.get(agent_id)
     
     def list_agents(self) -> List[Agent]:
         """List all agents.
         
         Returns:
-            List of agent information
+            List of agent information, without the compiled graphs and models
+        """
+        return list(self._agent_summaries.values())
+    
+    def list_agents_json(self) -> bytes:
+        """List all agents as a JSON array.
+        
+        Each agent's encoding is cached until the agent changes, so
+        repeated listings only join the cached bytes.
+        
+        Returns:
+            JSON-encoded list of agent information
+        """
+        entries = list(self._agents.values())
+        return b"[" + b",".join([entry.to_json() for entry in entries]) + b"]"
+    
+    def count(self) -> int:
+        """Get the number of registered agents.
+        
+        Returns:
+            Number of agents
         """
-        return [info["agent"] for info in self.agents.values()]
+        return self._count
     
     def delete_agent(self, agent_id: str) -> bool:
         """Delete an agent.
@@ -152,10 +278,13 @@ Important guidelines:
         Returns:
             True if deleted, False if not found
         """
-        if agent_id in self.agents:
-            del self.agents[agent_id]
+        with self._lock:
+            if agent_id not in self._agents:
+                return False
+            del self._agents[agent_id]
+            del self._agent_summaries[agent_id]
+            self._count -= 1
             return True
-        return False
     
     def execute_agent(
         self, 
@@ -174,58 +303,60 @@ Important guidelines:
             
         Returns:
             Execution result
+            
+        Raises:
+            AgentNotFoundError: If the agent does not exist
         """
-        if agent_id not in self.agents:
-            raise ValueError(f"Agent {agent_id} not found")
+        agent_info = self._agents.get(agent_id)
+        if agent_info is None:
+            raise AgentNotFoundError(f"Agent {agent_id} not found")
         
-        agent_info = self.agents[agent_id]
-        graph = agent_info["graph"]
+        graph = agent_info.graph
         
         # Generate session ID if not provided
         if not session_id:
             session_id = str(uuid.uuid4())
         
-        # For ReAct agents, use simpler state structure
-        if agent_info["tools"]:
-            # ReAct agent expects just messages
-            initial_state = {"messages": [HumanMessage(content=input_message)]}
-        else:
-            # Custom agent uses our state structure
-            initial_state = AgentState(
-                messages=[HumanMessage(content=input_message)],
-                iteration_count=0,
-                tool_calls=[],
-                session_id=session_id,
-                context=context or {}
-            )
+        # The state shape is fixed per agent, so its builder is chosen at build time
+        initial_state = agent_info.initial_state_fn(input_message, session_id, context)
         
         # Execute the graph
-        start_time = datetime.utcnow()
+        start_time = time.perf_counter()
         try:
             result = graph.invoke(initial_state)
             
-            # Update agent execution count and timestamp
-            agent_info["agent"].execution_count += 1
-            agent_info["agent"].last_executed_at = datetime.utcnow()
-            agent_info["agent"].status = AgentStatus.COMPLETED
+            execution_time = time.perf_counter() - start_time
+            finished_at = datetime.utcnow()
             
-            execution_time = (datetime.utcnow() - start_time).total_seconds()
+            # Update agent execution count and timestamp
+            with self._lock:
+                agent_info.agent.execution_count += 1
+                agent_info.agent.last_executed_at = finished_at
+                agent_info.agent.status = AgentStatus.COMPLETED
+                agent_info.serialized = None
             
-            # Extract response from the last AI message
+            # Extract the response, tool calls and serialized messages in one pass.
+            # All timestamps reflect the completion time, so format it once.
             messages = result.get("messages", [])
-            ai_messages = [msg for msg in messages if isinstance(msg, AIMessage)]
-            response_content = ai_messages[-1].content if ai_messages else "No response generated"
-            
-            # Extract tool calls if any
+            now_iso = finished_at.isoformat()
+            response_content = "No response generated"
             tool_calls = []
+            serialized_messages = []
             for msg in messages:
-                if isinstance(msg, AIMessage) and hasattr(msg, 'tool_calls') and msg.tool_calls:
-                    for tool_call in msg.tool_calls:
-                        tool_calls.append({
-                            "tool_name": tool_call.get("name", "unknown"),
-                            "tool_args": tool_call.get("args", {}),
-                            "timestamp": datetime.utcnow().isoformat()
-                        })
+                if isinstance(msg, AIMessage):
+                    response_content = msg.content
+                    if msg.tool_calls:
+                        for tool_call in msg.tool_calls:
+                            tool_calls.append({
+                                "tool_name": tool_call.get("name", "unknown"),
+                                "tool_args": tool_call.get("args", {}),
+                                "timestamp": now_iso
+                            })
+                serialized_messages.append({
+                    "type": msg.__class__.__name__,
+                    "content": msg.content,
+                    "timestamp": now_iso
+                })
             
             return {
                 "agent_id": agent_id,
@@ -235,19 +366,14 @@ Important guidelines:
                 "execution_time": execution_time,
                 "tool_calls": tool_calls,
                 "iteration_count": result.get("iteration_count", 1),
-                "messages": [
-                    {
-                        "type": type(msg).__name__,
-                        "content": msg.content,
-                        "timestamp": datetime.utcnow().isoformat()
-                    }
-                    for msg in messages
-                ]
+                "messages": serialized_messages
             }
             
         except Exception as e:
-            agent_info["agent"].status = AgentStatus.FAILED
-            execution_time = (datetime.utcnow() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
+            with self._lock:
+                agent_info.agent.status = AgentStatus.FAILED
+                agent_info.serialized = None
             
             return {
                 "agent_id": agent_id,
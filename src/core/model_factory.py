@@ -1,6 +1,8 @@
 """Factory for creating language models from different providers."""
 
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+import httpx
 from langchain_core.language_models import BaseLLM
 from langchain_openai import ChatOpenAI
 from langchain_aws import ChatBedrock
@@ -9,6 +11,55 @@ from ..config import get_settings
 from ..models import ModelConfig, ModelProvider
 
 
+# Supported models per provider, in display order
+_SUPPORTED_MODELS: Dict[ModelProvider, Tuple[str, ...]] = {
+    ModelProvider.OPENAI: (
+        "gpt-4",
+        "gpt-4-turbo",
+        "gpt-4-turbo-preview",
+        "gpt-3.5-turbo",
+        "gpt-3.5-turbo-16k",
+    ),
+    ModelProvider.BEDROCK: (
+        "anthropic.claude-3-opus-20240229-v1:0",
+        "anthropic.claude-3-sonnet-20240229-v1:0",
+        "anthropic.claude-3-haiku-20240307-v1:0",
+        "anthropic.claude-v2:1",
+        "anthropic.claude-v2",
+        "anthropic.claude-instant-v1",
+        "amazon.titan-text-express-v1",
+        "amazon.titan-text-lite-v1",
+        "ai21.j2-ultra-v1",
+        "ai21.j2-mid-v1",
+        "cohere.command-text-v14",
+        "meta.llama2-70b-chat-v1",
+        "meta.llama2-13b-chat-v1",
+    )
+}
+
+# Hash sets for O(1) membership checks in validate_model_config
+_SUPPORTED_MODEL_SETS: Dict[ModelProvider, FrozenSet[str]] = {
+    provider: frozenset(models) for provider, models in _SUPPORTED_MODELS.items()
+}
+
+# Precomputed payload for the /models endpoint
+_SUPPORTED_MODELS_BY_VALUE: Dict[str, Tuple[str, ...]] = {
+    provider.value: models for provider, models in _SUPPORTED_MODELS.items()
+}
+
+_http_client: Optional[httpx.Client] = None
+
+
+def _get_http_client() -> httpx.Client:
+    """Get the HTTP client shared by all OpenAI models."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.Client(
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=200)
+        )
+    return _http_client
+
+
 class ModelFactory:
     """Factory class for creating language models."""
     
@@ -26,6 +77,40 @@ class ModelFactory:
         Raises:
             ValueError: If the provider is not supported
         """
+        if kwargs:
+            # Extra parameters are not hashable in general, so skip the cache
+            return ModelFactory._build_model(config, **kwargs)
+        
+        return ModelFactory._get_or_create(
+            config.provider,
+            config.model_name,
+            config.temperature,
+            config.max_tokens,
+            config.top_p,
+        )
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _get_or_create(
+        provider: ModelProvider,
+        model_name: str,
+        temperature: float,
+        max_tokens: Optional[int],
+        top_p: Optional[float],
+    ) -> BaseLLM:
+        """Get a shared model instance for the given client parameters."""
+        config = ModelConfig(
+            provider=provider,
+            model_name=model_name,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            top_p=top_p,
+        )
+        return ModelFactory._build_model(config)
+    
+    @staticmethod
+    def _build_model(config: ModelConfig, **kwargs) -> BaseLLM:
+        """Construct a new language model for the configuration."""
         settings = get_settings()
         
         if config.provider == ModelProvider.OPENAI:
@@ -46,6 +131,7 @@ class ModelFactory:
             "model": config.model_name,
             "temperature": config.temperature,
             "api_key": settings.openai_api_key,
+            "http_client": _get_http_client(),
             **kwargs
         }
         
@@ -63,6 +149,9 @@ class ModelFactory:
         **kwargs
     ) -> ChatBedrock:
         """Create a Bedrock model."""
+        access_key_id = settings.aws_access_key_id
+        secret_access_key = settings.aws_secret_access_key
+        
         model_kwargs = {
             "model_id": config.model_name,
             "region_name": settings.aws_default_region,
@@ -78,46 +167,32 @@ class ModelFactory:
             model_kwargs["model_kwargs"]["top_p"] = config.top_p
             
         # Set AWS credentials if provided
-        if settings.aws_access_key_id and settings.aws_secret_access_key:
+        if access_key_id and secret_access_key:
             model_kwargs.update({
                 "credentials_profile_name": None,
-                "aws_access_key_id": settings.aws_access_key_id,
-                "aws_secret_access_key": settings.aws_secret_access_key,
+                "aws_access_key_id": access_key_id,
+                "aws_secret_access_key": secret_access_key,
             })
             
         return ChatBedrock(**model_kwargs)
     
     @staticmethod
-    def get_supported_models() -> Dict[ModelProvider, list]:
+    def get_supported_models() -> Dict[ModelProvider, Tuple[str, ...]]:
         """Get a list of supported models for each provider.
         
         Returns:
             Dictionary mapping providers to their supported models
         """
-        return {
-            ModelProvider.OPENAI: [
-                "gpt-4",
-                "gpt-4-turbo",
-                "gpt-4-turbo-preview",
-                "gpt-3.5-turbo",
-                "gpt-3.5-turbo-16k",
-            ],
-            ModelProvider.BEDROCK: [
-                "anthropic.claude-3-opus-20240229-v1:0",
-                "anthropic.claude-3-sonnet-20240229-v1:0",
-                "anthropic.claude-3-haiku-20240307-v1:0",
-                "anthropic.claude-v2:1",
-                "anthropic.claude-v2",
-                "anthropic.claude-instant-v1",
-                "amazon.titan-text-express-v1",
-                "amazon.titan-text-lite-v1",
-                "ai21.j2-ultra-v1",
-                "ai21.j2-mid-v1",
-                "cohere.command-text-v14",
-                "meta.llama2-70b-chat-v1",
-                "meta.llama2-13b-chat-v1",
-            ]
-        }
+        return _SUPPORTED_MODELS
+    
+    @staticmethod
+    def get_supported_models_by_value() -> Dict[str, Tuple[str, ...]]:
+        """Get the supported models keyed by provider name.
+        
+        Returns:
+            Dictionary mapping provider values to their supported models
+        """
+        return _SUPPORTED_MODELS_BY_VALUE
     
     @staticmethod
     def validate_model_config(config: ModelConfig) -> bool:
@@ -132,15 +207,15 @@ class ModelFactory:
         Raises:
             ValueError: If the configuration is invalid
         """
-        supported_models = ModelFactory.get_supported_models()
+        supported_models = _SUPPORTED_MODEL_SETS.get(config.provider)
         
-        if config.provider not in supported_models:
+        if supported_models is None:
             raise ValueError(f"Unsupported provider: {config.provider}")
         
-        if config.model_name not in supported_models[config.provider]:
+        if config.model_name not in supported_models:
             raise ValueError(
                 f"Unsupported model '{config.model_name}' for provider '{config.provider}'. "
-                f"Supported models: {supported_models[config.provider]}"
+                f"Supported models: {list(_SUPPORTED_MODELS[config.provider])}"
             )
         
         return True 
\ No newline at end of file
@@ -1,15 +1,388 @@
 """Built-in tools and tool management for LangGraph agents."""
 
+import ast
+import asyncio
+import functools
+import hashlib
+import inspect
 import json
 import os
+import re
+import shutil
+import signal
 import subprocess
-import requests
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Callable
-from langchain_core.tools import Tool
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import CodeType
+from typing import Any, Awaitable, Dict, List, Optional, Callable, Tuple
+import httpx
+import structlog
+from langchain_core.tools import BaseTool, StructuredTool, Tool
 from pydantic import BaseModel, Field
 
+from ..config import get_settings
 from ..models import ToolConfig
+from ..monitoring import get_metrics_collector
+
+logger = structlog.get_logger()
+
+
+@functools.lru_cache(maxsize=1)
+def _io_buffer_size() -> int:
+    """Get the buffer size for file tools, read from settings on first use.
+    
+    It is much larger than the 8 KiB default so large files take few
+    read/write syscalls.
+    """
+    return get_settings().tool_io_buffer_size
+
+# Content up to this size is written with a single os.write call
+_SINGLE_WRITE_LIMIT = 4 * 1024 * 1024
+
+
+# Directories known to exist, so repeated writes into the same workspace
+# skip the makedirs syscalls; cleared when it grows large
+_known_dirs: set = set()
+_known_dirs_lock = threading.Lock()
+_KNOWN_DIRS_LIMIT = 4096
+
+
+def _ensure_parent_dir(file_path: str):
+    """Create the parent directory of ``file_path`` unless known to exist."""
+    directory = os.path.dirname(file_path)
+    if not directory or directory in _known_dirs:
+        return
+    os.makedirs(directory, exist_ok=True)
+    with _known_dirs_lock:
+        if len(_known_dirs) >= _KNOWN_DIRS_LIMIT:
+            _known_dirs.clear()
+        _known_dirs.add(directory)
+
+
+def _forget_parent_dir(file_path: str):
+    """Drop a directory that turned out to be missing from the cache."""
+    with _known_dirs_lock:
+        _known_dirs.discard(os.path.dirname(file_path))
+
+
+def _write_with_parent_dir(file_path: str, write: Callable[[], None]):
+    """Run ``write`` after ensuring the parent directory of ``file_path``.
+    
+    If the cached directory was removed externally, the write fails with
+    FileNotFoundError; the directory is then recreated and the write
+    retried once, so the call still succeeds.
+    """
+    _ensure_parent_dir(file_path)
+    try:
+        write()
+    except FileNotFoundError:
+        _forget_parent_dir(file_path)
+        _ensure_parent_dir(file_path)
+        write()
+
+
+# Last formatted get_current_time result as (epoch second, text); the
+# output only changes once per second
+_time_cache: Tuple[int, str] = (-1, "")
+_strftime = time.strftime
+_localtime = time.localtime
+
+
+# Commands execute_shell_command refuses to run, compiled into one
+# case-insensitive pattern so each command is scanned once. Any word that
+# starts with a blocked name matches, so variants such as rmdir, sudoedit
+# and deluser stay blocked as they were under the old substring check.
+_DANGEROUS_COMMAND_RE = re.compile(
+    r'\b(?:rm|del|format|sudo|su|chmod|chown)',
+    re.IGNORECASE
+)
+
+
+# execute_shell_command reads output in chunks and keeps only the last
+# _SHELL_MAX_OUTPUT bytes of each stream, so memory stays bounded however
+# much a command prints
+_SHELL_TIMEOUT = 30
+_SHELL_CHUNK_SIZE = 64 * 1024
+_SHELL_MAX_OUTPUT = 1024 * 1024
+
+
+class _OutputTail:
+    """Thread-safe byte buffer keeping the last ``max_bytes`` written to it."""
+    
+    __slots__ = ("max_bytes", "_buffer", "_received", "_lock")
+    
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._buffer = bytearray()
+        self._received = 0
+        self._lock = threading.Lock()
+    
+    def append(self, chunk: bytes):
+        with self._lock:
+            self._received += len(chunk)
+            self._buffer += chunk
+            # Trim in batches so the front is not shifted on every chunk
+            if len(self._buffer) > 2 * self.max_bytes:
+                del self._buffer[:-self.max_bytes]
+    
+    def text(self) -> str:
+        """Decode the kept tail, marking it if earlier output was dropped."""
+        with self._lock:
+            data = bytes(self._buffer[-self.max_bytes:])
+            truncated = self._received > self.max_bytes
+        text = data.decode("utf-8", errors="replace")
+        return f"[output truncated]\n{text}" if truncated else text
+
+
+def _drain_tail(pipe: Any, tail: _OutputTail):
+    """Read a pipe to EOF, keeping only its tail in ``tail``."""
+    with pipe:
+        for chunk in iter(lambda: pipe.read1(_SHELL_CHUNK_SIZE), b""):
+            tail.append(chunk)
+
+
+# Pooled HTTP clients for http_request, created on first use so every call
+# reuses open connections instead of paying a TCP/TLS handshake
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=32)
+_HTTP_TIMEOUT = httpx.Timeout(30.0)
+_HTTP_HEADERS = {'Content-Type': 'application/json'}
+
+_http_client: Optional[httpx.Client] = None
+_async_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.Client:
+    """Get the shared synchronous HTTP client."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.Client(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT, follow_redirects=True)
+    return _http_client
+
+
+def _get_async_http_client() -> httpx.AsyncClient:
+    """Get the shared asynchronous HTTP client."""
+    global _async_http_client
+    if _async_http_client is None:
+        _async_http_client = httpx.AsyncClient(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT, follow_redirects=True)
+    return _async_http_client
+
+
+# In-flight GET requests by URL. Concurrent identical GETs (common when
+# several agents look up the same resource) wait on the first caller's
+# request instead of issuing their own.
+_inflight_gets: Dict[str, Future] = {}
+_inflight_gets_lock = threading.Lock()
+_async_inflight_gets: Dict[str, "asyncio.Future[httpx.Response]"] = {}
+
+
+def _coalesced_get(url: str) -> httpx.Response:
+    """GET a URL, sharing the response with concurrent callers."""
+    with _inflight_gets_lock:
+        future = _inflight_gets.get(url)
+        is_leader = future is None
+        if is_leader:
+            future = Future()
+            _inflight_gets[url] = future
+    
+    if not is_leader:
+        return future.result()
+    
+    try:
+        response = _get_http_client().get(url)
+        future.set_result(response)
+        return response
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_gets_lock:
+            del _inflight_gets[url]
+
+
+async def _acoalesced_get(url: str) -> httpx.Response:
+    """Async counterpart of _coalesced_get for the running event loop."""
+    future = _async_inflight_gets.get(url)
+    if future is not None:
+        return await asyncio.shield(future)
+    
+    future = asyncio.get_running_loop().create_future()
+    _async_inflight_gets[url] = future
+    try:
+        response = await _get_async_http_client().get(url)
+        future.set_result(response)
+        return response
+    except BaseException as e:
+        future.set_exception(e)
+        # Mark the exception as retrieved in case no caller was waiting
+        future.exception()
+        raise
+    finally:
+        del _async_inflight_gets[url]
+
+
+# Bounded pool that runs blocking tools for async agent runs, so file and
+# subprocess waits never stall the event loop
+_tool_pool: Optional[ThreadPoolExecutor] = None
+_tool_pool_lock = threading.Lock()
+
+
+def _get_tool_pool() -> ThreadPoolExecutor:
+    """Get the shared thread pool for blocking tools."""
+    global _tool_pool
+    if _tool_pool is None:
+        with _tool_pool_lock:
+            if _tool_pool is None:
+                _tool_pool = ThreadPoolExecutor(
+                    max_workers=get_settings().tool_pool_size,
+                    thread_name_prefix="tool"
+                )
+    return _tool_pool
+
+
+def shutdown_tool_pool():
+    """Shut down the thread pool used for blocking tools."""
+    global _tool_pool
+    with _tool_pool_lock:
+        if _tool_pool is not None:
+            _tool_pool.shutdown(wait=False)
+            _tool_pool = None
+
+
+def _threaded_coroutine(func: Callable[..., str]) -> Callable[..., Awaitable[str]]:
+    """Wrap a blocking tool function as a coroutine run on the tool pool."""
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _get_tool_pool(),
+            functools.partial(func, *args, **kwargs)
+        )
+    
+    return wrapper
+
+
+def _required_param_count(func: Callable[..., Any]) -> int:
+    """Count the parameters of ``func`` that have no default value."""
+    return sum(
+        1 for param in inspect.signature(func).parameters.values()
+        if param.default is inspect.Parameter.empty
+        and param.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    )
+
+
+async def close_http_clients():
+    """Close the shared HTTP clients used by http_request."""
+    global _http_client, _async_http_client
+    if _http_client is not None:
+        _http_client.close()
+        _http_client = None
+    if _async_http_client is not None:
+        await _async_http_client.aclose()
+        _async_http_client = None
+
+
+# AST nodes allowed in calculate expressions: numeric literals and arithmetic
+_CALC_ALLOWED_NODES = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Constant,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.FloorDiv,
+    ast.Mod,
+    ast.Pow,
+    ast.UAdd,
+    ast.USub,
+)
+
+# Translation table deleting every allowed character; anything left after
+# expression.translate() is invalid
+_CALC_STRIP_ALLOWED = str.maketrans('', '', '0123456789+-*/.() ')
+
+# Largest exponent accepted for ``**``, and largest result size (in bits)
+# any sub-expression may reach, so one expression cannot pin a CPU. Nested
+# powers such as (7**1000)**1000 stay under the exponent cap but not this one.
+_CALC_MAX_EXPONENT = 1000
+_CALC_MAX_RESULT_BITS = 65536
+
+
+def _result_bits(node: ast.AST) -> Optional[int]:
+    """Upper bound on the bit length of a validated integer expression.
+    
+    Float arithmetic is bounded by the float range (and raises OverflowError
+    past it), so only integer results are sized.
+    
+    Returns:
+        Bit-length bound, or None if the value is a float
+        
+    Raises:
+        ValueError: If an integer result could exceed _CALC_MAX_RESULT_BITS
+    """
+    if isinstance(node, ast.Expression):
+        return _result_bits(node.body)
+    if isinstance(node, ast.Constant):
+        return None if isinstance(node.value, float) else node.value.bit_length()
+    if isinstance(node, ast.UnaryOp):
+        return _result_bits(node.operand)
+    
+    left = _result_bits(node.left)
+    right = _result_bits(node.right)
+    op = node.op
+    if left is None or right is None or isinstance(op, ast.Div):
+        return None
+    if isinstance(op, (ast.Add, ast.Sub)):
+        bits = max(left, right) + 1
+    elif isinstance(op, ast.Mult):
+        bits = left + right
+    elif isinstance(op, ast.Pow):
+        # The exponent is an int literal here, checked by _compile_expression
+        exponent = node.right
+        if isinstance(exponent, ast.UnaryOp):
+            if isinstance(exponent.op, ast.USub):
+                return None
+            exponent = exponent.operand
+        bits = left * exponent.value
+    else:
+        # FloorDiv and Mod never grow the magnitude past the dividend
+        bits = left
+    
+    if bits > _CALC_MAX_RESULT_BITS:
+        raise ValueError(f"Result would exceed {_CALC_MAX_RESULT_BITS} bits")
+    return bits
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_expression(expression: str) -> CodeType:
+    """Validate and compile a calculate expression.
+    
+    Args:
+        expression: Mathematical expression
+        
+    Returns:
+        Compiled code object for the expression
+        
+    Raises:
+        ValueError: If the expression uses anything but numeric arithmetic
+    """
+    tree = ast.parse(expression, mode='eval')
+    for node in ast.walk(tree):
+        if not isinstance(node, _CALC_ALLOWED_NODES):
+            raise ValueError(f"Unsupported expression element: {type(node).__name__}")
+        if isinstance(node, ast.Constant) and type(node.value) not in (int, float):
+            raise ValueError("Only numeric constants are allowed")
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Pow):
+            exponent = node.right
+            if isinstance(exponent, ast.UnaryOp):
+                exponent = exponent.operand
+            if not isinstance(exponent, ast.Constant) or abs(exponent.value) > _CALC_MAX_EXPONENT:
+                raise ValueError(f"Exponents must be numeric literals up to {_CALC_MAX_EXPONENT}")
+    _result_bits(tree)
+    return compile(tree, '<calc>', 'eval')
 
 
 class BuiltInTools:
@@ -18,7 +391,15 @@ class BuiltInTools:
     @staticmethod
     def get_current_time() -> str:
         """Get the current date and time."""
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        global _time_cache
+        second = int(time.time())
+        cached = _time_cache
+        if cached[0] == second:
+            return cached[1]
+        
+        formatted = _strftime("%Y-%m-%d %H:%M:%S", _localtime(second))
+        _time_cache = (second, formatted)
+        return formatted
     
     @staticmethod
     def calculate(expression: str) -> str:
@@ -32,11 +413,10 @@ class BuiltInTools:
         """
         try:
             # Only allow safe mathematical operations
-            allowed_chars = set('0123456789+-*/.() ')
-            if not all(c in allowed_chars for c in expression):
+            if expression.translate(_CALC_STRIP_ALLOWED):
                 return "Error: Invalid characters in expression"
             
-            result = eval(expression)
+            result = eval(_compile_expression(expression), {'__builtins__': {}}, {})
             return str(result)
         except Exception as e:
             return f"Error: {str(e)}"
@@ -70,8 +450,11 @@ class BuiltInTools:
             File content or error message
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            # Read raw bytes in one pass (the file size is known up front)
+            # and decode once, instead of decoding through a text wrapper
+            with open(file_path, 'rb', buffering=_io_buffer_size()) as f:
+                data = f.read()
+            return data.decode('utf-8')
         except Exception as e:
             return f"Error reading file: {str(e)}"
     
@@ -87,13 +470,51 @@ class BuiltInTools:
             Success or error message
         """
         try:
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            data = content.encode('utf-8')
+            
+            def write():
+                if len(data) <= _SINGLE_WRITE_LIMIT:
+                    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+                    try:
+                        view = memoryview(data)
+                        while view:
+                            view = view[os.write(fd, view):]
+                    finally:
+                        os.close(fd)
+                else:
+                    with open(file_path, 'wb', buffering=_io_buffer_size()) as f:
+                        f.write(data)
+            
+            _write_with_parent_dir(file_path, write)
+            _invalidate_read_cache(file_path)
             return f"Successfully wrote to {file_path}"
         except Exception as e:
             return f"Error writing file: {str(e)}"
     
+    @staticmethod
+    def copy_file(source_path: str, destination_path: str) -> str:
+        """Copy a file without passing its content through the agent.
+        
+        ``shutil.copyfile`` copies in the kernel (``os.sendfile`` on Linux),
+        so large files never get decoded into Python strings.
+        
+        Args:
+            source_path: Path to the file to copy
+            destination_path: Path to write the copy to
+            
+        Returns:
+            Success or error message
+        """
+        try:
+            _write_with_parent_dir(
+                destination_path,
+                lambda: shutil.copyfile(source_path, destination_path)
+            )
+            _invalidate_read_cache(destination_path)
+            return f"Successfully copied {source_path} to {destination_path}"
+        except Exception as e:
+            return f"Error copying file: {str(e)}"
+    
     @staticmethod
     def execute_shell_command(command: str) -> str:
         """Execute a shell command (with safety restrictions).
@@ -105,21 +526,45 @@ class BuiltInTools:
             Command output or error message
         """
         # Safety restrictions - only allow safe commands
-        dangerous_commands = ['rm', 'del', 'format', 'sudo', 'su', 'chmod', 'chown']
-        if any(cmd in command.lower() for cmd in dangerous_commands):
+        if _DANGEROUS_COMMAND_RE.search(command):
             return "Error: Command not allowed for security reasons"
         
         try:
-            result = subprocess.run(
-                command, 
-                shell=True, 
-                capture_output=True, 
-                text=True, 
-                timeout=30
+            process = subprocess.Popen(
+                command,
+                shell=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                # Own process group, so a timeout kills the shell's children too
+                start_new_session=os.name == "posix"
             )
-            return f"Exit code: {result.returncode}\nOutput: {result.stdout}\nError: {result.stderr}"
-        except subprocess.TimeoutExpired:
-            return "Error: Command timed out"
+            stdout_tail = _OutputTail(_SHELL_MAX_OUTPUT)
+            stderr_tail = _OutputTail(_SHELL_MAX_OUTPUT)
+            readers = [
+                threading.Thread(target=_drain_tail, args=(process.stdout, stdout_tail), daemon=True),
+                threading.Thread(target=_drain_tail, args=(process.stderr, stderr_tail), daemon=True),
+            ]
+            for reader in readers:
+                reader.start()
+            
+            try:
+                returncode = process.wait(timeout=_SHELL_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                if os.name == "posix":
+                    os.killpg(process.pid, signal.SIGKILL)
+                else:
+                    process.kill()
+                process.wait()
+                return "Error: Command timed out"
+            finally:
+                for reader in readers:
+                    reader.join(timeout=1)
+            
+            # Readers still held open by background children may keep
+            # appending; text() snapshots each tail under its lock
+            stdout = stdout_tail.text()
+            stderr = stderr_tail.text()
+            return f"Exit code: {returncode}\nOutput: {stdout}\nError: {stderr}"
         except Exception as e:
             return f"Error executing command: {str(e)}"
     
@@ -136,11 +581,36 @@ class BuiltInTools:
             Response content or error message
         """
         try:
-            if method.upper() == "GET":
-                response = requests.get(url, timeout=30)
-            elif method.upper() == "POST":
-                headers = {'Content-Type': 'application/json'}
-                response = requests.post(url, data=data, headers=headers, timeout=30)
+            method = method.upper()
+            if method == "GET":
+                response = _coalesced_get(url)
+            elif method == "POST":
+                response = _get_http_client().post(url, content=data, headers=_HTTP_HEADERS)
+            else:
+                return f"Error: Unsupported HTTP method: {method}"
+            
+            return f"Status: {response.status_code}\nContent: {response.text[:1000]}"
+        except Exception as e:
+            return f"Error making HTTP request: {str(e)}"
+    
+    @staticmethod
+    async def ahttp_request(url: str, method: str = "GET", data: Optional[str] = None) -> str:
+        """Make an HTTP request without blocking the event loop.
+        
+        Args:
+            url: URL to request
+            method: HTTP method (GET, POST, etc.)
+            data: Request data (for POST requests)
+            
+        Returns:
+            Response content or error message
+        """
+        try:
+            method = method.upper()
+            if method == "GET":
+                response = await _acoalesced_get(url)
+            elif method == "POST":
+                response = await _get_async_http_client().post(url, content=data, headers=_HTTP_HEADERS)
             else:
                 return f"Error: Unsupported HTTP method: {method}"
             
@@ -149,117 +619,188 @@ class BuiltInTools:
             return f"Error making HTTP request: {str(e)}"
 
 
+# Native coroutine implementations of built-in tools, used when agents run
+# asynchronously
+_BUILTIN_TOOL_COROUTINES: Dict[str, Callable[..., Awaitable[str]]] = {
+    "http_request": BuiltInTools.ahttp_request,
+}
+
+# Built-in tools that block on disk or subprocess I/O; async runs dispatch
+# them to the tool pool
+_BLOCKING_TOOLS = frozenset({"read_file", "write_file", "copy_file", "execute_shell_command"})
+
+
+class _ToolResultCache:
+    """Thread-safe LRU cache with per-entry expiry for tool results."""
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Any, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Any) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+    
+    def set(self, key: Any, value: str):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def discard_if(self, predicate: Callable[[Any], bool]):
+        """Drop every entry whose key matches ``predicate``."""
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+
+# Returned by a cache key function when a call must not be cached
+_NO_CACHE = object()
+
+
+def _read_file_cache_key(file_path: str) -> Any:
+    """Key reads on the file's path, inode, size and mtime.
+    
+    Together they invalidate cached content when the file changes, even
+    within the filesystem's mtime granularity.
+    """
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return _NO_CACHE
+    return (os.path.abspath(file_path), st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def _invalidate_read_cache(file_path: str):
+    """Drop cached read_file results for a path the tools just wrote."""
+    path = os.path.abspath(file_path)
+    _tool_result_cache.discard_if(
+        lambda key: key[0] == "read_file" and key[1][0] == path
+    )
+
+
+def _http_request_cache_key(url: str, method: str = "GET", data: Optional[str] = None) -> Any:
+    """Only GET requests are idempotent enough to cache."""
+    return None if method.upper() == "GET" else _NO_CACHE
+
+
+# Deterministic built-in tools whose results can be reused, mapped to an
+# optional function returning extra key material (or _NO_CACHE to bypass).
+# write_file, execute_shell_command and get_current_time are never cached.
+_CACHEABLE_TOOLS: Dict[str, Optional[Callable[..., Any]]] = {
+    "calculate": None,
+    "web_search": None,
+    "read_file": _read_file_cache_key,
+    "http_request": _http_request_cache_key,
+}
+
+_tool_result_cache = _ToolResultCache(maxsize=1024, ttl=300.0)
+
+# Larger results (typically whole files) are returned but not kept, so the
+# cache holds at most maxsize * this many characters
+_CACHE_MAX_RESULT_CHARS = 64 * 1024
+
+
+def _is_cacheable_result(tool_name: str, result: str) -> bool:
+    """Check whether a tool result may be stored in the result cache.
+    
+    Errors, oversized results and non-2xx HTTP responses are not cached, so
+    a transient upstream failure is not served for the whole TTL.
+    """
+    if result.startswith("Error") or len(result) > _CACHE_MAX_RESULT_CHARS:
+        return False
+    if tool_name == "http_request":
+        return result.startswith("Status: 2")
+    return True
+
+
+def _tool_cache_key(tool_name: str, key_fn: Optional[Callable[..., Any]], args: tuple, kwargs: dict) -> Any:
+    """Build the cache key for a tool call, or _NO_CACHE to bypass the cache."""
+    extra = key_fn(*args, **kwargs) if key_fn is not None else None
+    if extra is _NO_CACHE:
+        return _NO_CACHE
+    encoded = json.dumps([args, kwargs], sort_keys=True, default=str).encode()
+    return (tool_name, extra, hashlib.blake2b(encoded, digest_size=16).digest())
+
+
+def _cached_tool(tool_name: str, func: Callable[..., str]) -> Callable[..., str]:
+    """Wrap a tool function so repeated identical calls reuse the result.
+    
+    Only results accepted by _is_cacheable_result are stored.
+    """
+    key_fn = _CACHEABLE_TOOLS[tool_name]
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = _tool_cache_key(tool_name, key_fn, args, kwargs)
+        if key is _NO_CACHE:
+            return func(*args, **kwargs)
+        
+        result = _tool_result_cache.get(key)
+        if result is not None:
+            get_metrics_collector().record_cache_hit(tool_name)
+            return result
+        
+        get_metrics_collector().record_cache_miss(tool_name)
+        result = func(*args, **kwargs)
+        if _is_cacheable_result(tool_name, result):
+            _tool_result_cache.set(key, result)
+        return result
+    
+    return wrapper
+
+
+def _cached_tool_coroutine(
+    tool_name: str,
+    coroutine: Callable[..., Awaitable[str]]
+) -> Callable[..., Awaitable[str]]:
+    """Async counterpart of _cached_tool, sharing the same cache."""
+    key_fn = _CACHEABLE_TOOLS[tool_name]
+    
+    @functools.wraps(coroutine)
+    async def wrapper(*args, **kwargs):
+        key = _tool_cache_key(tool_name, key_fn, args, kwargs)
+        if key is _NO_CACHE:
+            return await coroutine(*args, **kwargs)
+        
+        result = _tool_result_cache.get(key)
+        if result is not None:
+            get_metrics_collector().record_cache_hit(tool_name)
+            return result
+        
+        get_metrics_collector().record_cache_miss(tool_name)
+        result = await coroutine(*args, **kwargs)
+        if _is_cacheable_result(tool_name, result):
+            _tool_result_cache.set(key, result)
+        return result
+    
+    return wrapper
+
+
 class ToolManager:
     """Manager for creating and managing tools for agents."""
     
     def __init__(self):
-        self.built_in_tools = self._get_built_in_tools()
+        # The built-in registry is static, so every manager shares it
+        self.built_in_tools = _BUILTIN_TOOL_CONFIGS
         self.custom_tools: Dict[str, Callable] = {}
+        # Tools are stateless, so agents with the same tool config share one
+        # instance; bounded LRU since descriptions come from user configs
+        self._tool_cache: "OrderedDict[tuple, BaseTool]" = OrderedDict()
+        self._tool_cache_lock = threading.Lock()
+        self._tool_cache_size = 512
     
-    def _get_built_in_tools(self) -> Dict[str, ToolConfig]:
-        """Get configurations for built-in tools."""
-        return {
-            "get_current_time": ToolConfig(
-                name="get_current_time",
-                description="Get the current date and time",
-                function_name="get_current_time",
-                parameters={},
-                required_params=[]
-            ),
-            "calculate": ToolConfig(
-                name="calculate",
-                description="Safely evaluate a mathematical expression",
-                function_name="calculate",
-                parameters={
-                    "expression": {
-                        "type": "string",
-                        "description": "Mathematical expression to evaluate"
-                    }
-                },
-                required_params=["expression"]
-            ),
-            "web_search": ToolConfig(
-                name="web_search",
-                description="Perform a web search",
-                function_name="web_search",
-                parameters={
-                    "query": {
-                        "type": "string",
-                        "description": "Search query"
-                    },
-                    "num_results": {
-                        "type": "integer",
-                        "description": "Number of results to return",
-                        "default": 5
-                    }
-                },
-                required_params=["query"]
-            ),
-            "read_file": ToolConfig(
-                name="read_file",
-                description="Read content from a file",
-                function_name="read_file",
-                parameters={
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to the file to read"
-                    }
-                },
-                required_params=["file_path"]
-            ),
-            "write_file": ToolConfig(
-                name="write_file",
-                description="Write content to a file",
-                function_name="write_file",
-                parameters={
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to the file to write"
-                    },
-                    "content": {
-                        "type": "string",
-                        "description": "Content to write to the file"
-                    }
-                },
-                required_params=["file_path", "content"]
-            ),
-            "execute_shell_command": ToolConfig(
-                name="execute_shell_command",
-                description="Execute a shell command (with safety restrictions)",
-                function_name="execute_shell_command",
-                parameters={
-                    "command": {
-                        "type": "string",
-                        "description": "Shell command to execute"
-                    }
-                },
-                required_params=["command"]
-            ),
-            "http_request": ToolConfig(
-                name="http_request",
-                description="Make an HTTP request",
-                function_name="http_request",
-                parameters={
-                    "url": {
-                        "type": "string",
-                        "description": "URL to request"
-                    },
-                    "method": {
-                        "type": "string",
-                        "description": "HTTP method (GET, POST, etc.)",
-                        "default": "GET"
-                    },
-                    "data": {
-                        "type": "string",
-                        "description": "Request data (for POST requests)",
-                        "default": None
-                    }
-                },
-                required_params=["url"]
-            )
-        }
-    
-    def create_tool(self, tool_config: ToolConfig) -> Tool:
+    def create_tool(self, tool_config: ToolConfig) -> BaseTool:
         """Create a LangChain Tool from a ToolConfig.
         
         Args:
@@ -268,19 +809,62 @@ class ToolManager:
         Returns:
             LangChain Tool instance
         """
+        custom_func = self.custom_tools.get(tool_config.name)
+        key = (
+            tool_config.name,
+            tool_config.description,
+            tool_config.function_name,
+            id(custom_func) if custom_func is not None else None,
+        )
+        with self._tool_cache_lock:
+            tool = self._tool_cache.get(key)
+            if tool is not None:
+                self._tool_cache.move_to_end(key)
+                return tool
+        
+        tool = self._build_tool(tool_config)
+        
+        with self._tool_cache_lock:
+            self._tool_cache[key] = tool
+            if len(self._tool_cache) > self._tool_cache_size:
+                self._tool_cache.popitem(last=False)
+        return tool
+    
+    def _build_tool(self, tool_config: ToolConfig) -> BaseTool:
+        """Build a new LangChain Tool for a ToolConfig."""
+        coroutine = None
         if tool_config.name in self.built_in_tools:
             # Use built-in tool function
-            func = getattr(BuiltInTools, tool_config.function_name)
+            func = _BUILTIN_TOOL_FUNCS[tool_config.name]
+            coroutine = _BUILTIN_TOOL_COROUTINES.get(tool_config.name)
+            if tool_config.name in _CACHEABLE_TOOLS:
+                func = _cached_tool(tool_config.name, func)
+                if coroutine is not None:
+                    coroutine = _cached_tool_coroutine(tool_config.name, coroutine)
+            if tool_config.name in _BLOCKING_TOOLS:
+                coroutine = _threaded_coroutine(func)
         elif tool_config.name in self.custom_tools:
             # Use custom tool function
             func = self.custom_tools[tool_config.name]
         else:
             raise ValueError(f"Tool '{tool_config.name}' not found")
         
+        # Tool passes a single string input, so functions needing several
+        # arguments (write_file, copy_file) get a schema built from their
+        # signature instead
+        if _required_param_count(func) > 1:
+            return StructuredTool.from_function(
+                func=func,
+                coroutine=coroutine,
+                name=tool_config.name,
+                description=tool_config.description
+            )
+        
         return Tool(
             name=tool_config.name,
             description=tool_config.description,
-            func=func
+            func=func,
+            coroutine=coroutine
         )
     
     def register_custom_tool(self, name: str, func: Callable, config: ToolConfig):
@@ -302,7 +886,7 @@ class ToolManager:
         """
         return list(self.built_in_tools.values())
     
-    def create_tools_from_configs(self, tool_configs: List[ToolConfig]) -> List[Tool]:
+    def create_tools_from_configs(self, tool_configs: List[ToolConfig]) -> List[BaseTool]:
         """Create multiple tools from configurations.
         
         Args:
@@ -313,9 +897,136 @@ class ToolManager:
         """
         tools = []
         for config in tool_configs:
+            # Unknown tools are the common failure, so check before building
+            if config.name not in self.built_in_tools and config.name not in self.custom_tools:
+                logger.warning("Tool not found", tool_name=config.name)
+                continue
             try:
-                tool = self.create_tool(config)
-                tools.append(tool)
+                tools.append(self.create_tool(config))
             except Exception as e:
-                print(f"Warning: Failed to create tool '{config.name}': {e}")
-        return tools 
\ No newline at end of file
+                logger.warning("Failed to create tool", tool_name=config.name, error=str(e))
+        return tools
+
+
+# Configurations for built-in tools, built once at import
+_BUILTIN_TOOL_CONFIGS: Dict[str, ToolConfig] = {
+    "get_current_time": ToolConfig(
+        name="get_current_time",
+        description="Get the current date and time",
+        function_name="get_current_time",
+        parameters={},
+        required_params=[]
+    ),
+    "calculate": ToolConfig(
+        name="calculate",
+        description="Safely evaluate a mathematical expression",
+        function_name="calculate",
+        parameters={
+            "expression": {
+                "type": "string",
+                "description": "Mathematical expression to evaluate"
+            }
+        },
+        required_params=["expression"]
+    ),
+    "web_search": ToolConfig(
+        name="web_search",
+        description="Perform a web search",
+        function_name="web_search",
+        parameters={
+            "query": {
+                "type": "string",
+                "description": "Search query"
+            },
+            "num_results": {
+                "type": "integer",
+                "description": "Number of results to return",
+                "default": 5
+            }
+        },
+        required_params=["query"]
+    ),
+    "read_file": ToolConfig(
+        name="read_file",
+        description="Read content from a file",
+        function_name="read_file",
+        parameters={
+            "file_path": {
+                "type": "string",
+                "description": "Path to the file to read"
+            }
+        },
+        required_params=["file_path"]
+    ),
+    "write_file": ToolConfig(
+        name="write_file",
+        description="Write content to a file",
+        function_name="write_file",
+        parameters={
+            "file_path": {
+                "type": "string",
+                "description": "Path to the file to write"
+            },
+            "content": {
+                "type": "string",
+                "description": "Content to write to the file"
+            }
+        },
+        required_params=["file_path", "content"]
+    ),
+    "copy_file": ToolConfig(
+        name="copy_file",
+        description="Copy a file to another path without reading its content",
+        function_name="copy_file",
+        parameters={
+            "source_path": {
+                "type": "string",
+                "description": "Path to the file to copy"
+            },
+            "destination_path": {
+                "type": "string",
+                "description": "Path to write the copy to"
+            }
+        },
+        required_params=["source_path", "destination_path"]
+    ),
+    "execute_shell_command": ToolConfig(
+        name="execute_shell_command",
+        description="Execute a shell command (with safety restrictions)",
+        function_name="execute_shell_command",
+        parameters={
+            "command": {
+                "type": "string",
+                "description": "Shell command to execute"
+            }
+        },
+        required_params=["command"]
+    ),
+    "http_request": ToolConfig(
+        name="http_request",
+        description="Make an HTTP request",
+        function_name="http_request",
+        parameters={
+            "url": {
+                "type": "string",
+                "description": "URL to request"
+            },
+            "method": {
+                "type": "string",
+                "description": "HTTP method (GET, POST, etc.)",
+                "default": "GET"
+            },
+            "data": {
+                "type": "string",
+                "description": "Request data (for POST requests)",
+                "default": None
+            }
+        },
+        required_params=["url"]
+    )
+}
+
+_BUILTIN_TOOL_FUNCS: Dict[str, Callable[..., str]] = {
+    name: getattr(BuiltInTools, config.function_name)
+    for name, config in _BUILTIN_TOOL_CONFIGS.items()
+}
@@ -1,15 +1,21 @@
 """Main FastAPI application for the LangGraph Agent Builder System."""
 
+import asyncio
 import os
+import sys
+import time
+import anyio
+import orjson
 import structlog
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
 
-from .api import router
+from .api import ORJSONResponse, router
 from .config import get_settings
-from .monitoring import metrics_collector
+from .core.tools import close_http_clients, shutdown_tool_pool
+from .monitoring import get_metrics_collector
 
 
 # Configure structured logging
@@ -33,6 +39,20 @@ structlog.configure(
 
 logger = structlog.get_logger()
 
+# High-frequency probe endpoints that are not worth a log line per request
+_SKIP_LOG_PATHS = frozenset({"/api/v1/health", "/api/v1/metrics/prometheus"})
+
+
+async def _refresh_prometheus_export():
+    """Keep the cached Prometheus export warm for scrapers."""
+    metrics_collector = get_metrics_collector()
+    while True:
+        try:
+            await anyio.to_thread.run_sync(metrics_collector.refresh_prometheus_export)
+        except Exception as e:
+            logger.warning("Prometheus export refresh failed", error=str(e))
+        await anyio.sleep(metrics_collector.prometheus_ttl)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -43,6 +63,10 @@ async def lifespan(app: FastAPI):
     # Load environment variables
     settings = get_settings()
     
+    # Sync route handlers run in the default thread pool; LLM latency
+    # dominates, so allow more concurrent workers than anyio's default of 40
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.threadpool_size
+    
     # Configure LangSmith tracing if enabled
     if settings.langchain_tracing_v2 and settings.langchain_api_key:
         os.environ["LANGCHAIN_TRACING_V2"] = "true"
@@ -55,10 +79,15 @@ async def lifespan(app: FastAPI):
         if settings.langchain_tracing_v2 and not settings.langchain_api_key:
             logger.warning("LangSmith tracing requested but no API key provided - tracing disabled")
     
+    prometheus_refresher = asyncio.create_task(_refresh_prometheus_export())
+    
     yield
     
     # Shutdown
     logger.info("Shutting down LangGraph Agent Builder System")
+    prometheus_refresher.cancel()
+    await close_http_clients()
+    shutdown_tool_pool()
 
 
 def create_app() -> FastAPI:
@@ -72,7 +101,8 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
         docs_url="/docs",
         redoc_url="/redoc",
-        openapi_url="/openapi.json"
+        openapi_url="/openapi.json",
+        default_response_class=ORJSONResponse
     )
     
     # Add CORS middleware
@@ -84,16 +114,24 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
     
+    # Compress larger JSON payloads (execution transcripts, agent lists)
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=4)
+    
     # Add request logging middleware
+    log_info = logger.info
+    
     @app.middleware("http")
     async def log_requests(request: Request, call_next):
-        """Log all HTTP requests."""
-        start_time = time.time()
+        """Log all HTTP requests except health checks and metric scrapes."""
+        if request.url.path in _SKIP_LOG_PATHS:
+            return await call_next(request)
+        
+        start = time.perf_counter_ns()
         
         response = await call_next(request)
         
-        process_time = time.time() - start_time
-        logger.info(
+        process_time = (time.perf_counter_ns() - start) / 1e9
+        log_info(
             "HTTP request processed",
             method=request.method,
             url=str(request.url),
@@ -115,9 +153,9 @@ def create_app() -> FastAPI:
             exc_info=True
         )
         
-        metrics_collector.record_error("unhandled_exception", str(exc))
+        get_metrics_collector().record_error("unhandled_exception", exc)
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "detail": "Internal server error",
@@ -128,25 +166,24 @@ def create_app() -> FastAPI:
     # Include API routes
     app.include_router(router, prefix="/api/v1")
     
-    # Root endpoint
+    # Root endpoint; its payload never changes, so encode it once
+    root_response = orjson.dumps({
+        "name": settings.app_name,
+        "version": settings.app_version,
+        "description": "LangGraph Agent Builder System",
+        "docs_url": "/docs",
+        "health_url": "/api/v1/health",
+        "metrics_url": "/api/v1/metrics/prometheus"
+    })
+    
     @app.get("/")
     async def root():
         """Root endpoint with basic information."""
-        return {
-            "name": settings.app_name,
-            "version": settings.app_version,
-            "description": "LangGraph Agent Builder System",
-            "docs_url": "/docs",
-            "health_url": "/api/v1/health",
-            "metrics_url": "/api/v1/metrics/prometheus"
-        }
+        return Response(content=root_response, media_type="application/json")
     
     return app
 
 
-# Import time for middleware
-import time
-
 # Create the application instance
 app = create_app()
 
@@ -161,5 +198,11 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
-        log_level=settings.log_level.lower()
+        log_level=settings.log_level.lower(),
+        # uvloop and httptools ship with uvicorn[standard]; pin them so a
+        # missing extra fails loudly instead of silently using the slower
+        # asyncio loop and h11 parser
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        timeout_keep_alive=75
     ) 
\ No newline at end of file
@@ -3,7 +3,7 @@
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional, Union
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ModelProvider(str, Enum):
@@ -23,6 +23,8 @@ class AgentStatus(str, Enum):
 
 class ToolConfig(BaseModel):
     """Configuration for a tool that can be used by an agent."""
+    model_config = ConfigDict(frozen=True)
+    
     name: str = Field(..., description="Name of the tool")
     description: str = Field(..., description="Description of what the tool does")
     function_name: str = Field(..., description="Python function name to call")
@@ -1,9 +1,19 @@
 """Monitoring package for the LangGraph Agent Builder System."""
 
-from .metrics import MetricsCollector, PerformanceMonitor, metrics_collector
+from typing import Any
+
+from .metrics import MetricsCollector, PerformanceMonitor, get_metrics_collector
 
 __all__ = [
     "MetricsCollector",
     "PerformanceMonitor",
+    "get_metrics_collector",
     "metrics_collector",
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    # The global collector is created on first access, not at import
+    if name == "metrics_collector":
+        return get_metrics_collector()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
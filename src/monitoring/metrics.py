@@ -1,51 +1,97 @@
 """Monitoring and metrics system for the LangGraph Agent Builder."""
 
+import threading
+import logging
 import time
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
-from prometheus_client import Counter, Histogram, Gauge, CollectorRegistry, generate_latest
+from collections import Counter as TallyCounter, deque
+from datetime import datetime
+from enum import IntEnum
+from functools import lru_cache
+from typing import TYPE_CHECKING, Deque, Dict, List, Any, Optional, Tuple
+import orjson
 import structlog
 
+if TYPE_CHECKING:
+    from prometheus_client import CollectorRegistry
+
 logger = structlog.get_logger()
+# stdlib logger behind ``logger`` (structlog's LoggerFactory names it after
+# this module); used for level checks, which every structlog version supports
+_level_logger = logging.getLogger(__name__)
+
+
+class _StatusCode(IntEnum):
+    """Execution status as stored in history records."""
+    UNKNOWN = 0
+    COMPLETED = 1
+    FAILED = 2
+
+
+_STATUS_CODES: Dict[str, _StatusCode] = {
+    'completed': _StatusCode.COMPLETED,
+    'failed': _StatusCode.FAILED,
+}
 
 
 class MetricsCollector:
     """Collects and manages metrics for agent performance monitoring."""
     
-    def __init__(self, registry: Optional[CollectorRegistry] = None):
+    def __init__(
+        self,
+        registry: Optional["CollectorRegistry"] = None,
+        system_metrics_ttl: float = 1.0,
+        prometheus_ttl: float = 5.0
+    ):
         """Initialize metrics collector.
         
         Args:
             registry: Prometheus registry, creates new one if None
+            system_metrics_ttl: Seconds to reuse a computed system metrics summary
+            prometheus_ttl: Seconds to reuse an encoded Prometheus export
         """
-        self.registry = registry or CollectorRegistry()
+        # Imported here so importing the package stays cheap until a
+        # collector is actually needed
+        from prometheus_client import Counter, Histogram, Gauge, CollectorRegistry
         
-        # Agent execution metrics
+        self.registry = registry or CollectorRegistry()
+        self.system_metrics_ttl = system_metrics_ttl
+        self._system_metrics_cache: Optional[Tuple[Dict[str, Any], float]] = None
+        self._system_metrics_json: Optional[Tuple[Dict[str, Any], bytes]] = None
+        self._system_metrics_lock = threading.Lock()
+        self.prometheus_ttl = prometheus_ttl
+        self._prometheus_cache: Optional[Tuple[bytes, float]] = None
+        self._prometheus_lock = threading.Lock()
+        
+        # Agent execution metrics. Agent IDs are not labels: every agent would
+        # add its own series (and histogram buckets) and the count is
+        # unbounded. Per-agent figures come from get_agent_metrics instead.
         self.agent_executions_total = Counter(
             'agent_executions_total',
             'Total number of agent executions',
-            ['agent_id', 'status'],
+            ['status'],
             registry=self.registry
         )
         
         self.agent_execution_duration = Histogram(
             'agent_execution_duration_seconds',
             'Duration of agent executions',
-            ['agent_id'],
+            # LLM agent runs take seconds to minutes, well beyond the default
+            # buckets' sub-second web-latency range
+            buckets=(0.5, 1, 2, 5, 10, 30, 60, 120, 300, float('inf')),
             registry=self.registry
         )
         
         self.agent_token_usage = Counter(
             'agent_token_usage_total',
             'Total tokens used by agents',
-            ['agent_id', 'token_type'],
+            ['token_type'],
             registry=self.registry
         )
         
         self.agent_tool_calls = Counter(
             'agent_tool_calls_total',
             'Total tool calls made by agents',
-            ['agent_id', 'tool_name'],
+            ['tool_name'],
             registry=self.registry
         )
         
@@ -69,8 +115,27 @@ class MetricsCollector:
             registry=self.registry
         )
         
-        # In-memory storage for detailed metrics
-        self.detailed_metrics: Dict[str, List[Dict[str, Any]]] = {}
+        self.tool_cache_requests = Counter(
+            'tool_cache_requests_total',
+            'Tool result cache lookups',
+            ['tool_name', 'result'],
+            registry=self.registry
+        )
+        
+        # Resolved label children per metric, keyed by label values, so hot
+        # paths skip prometheus_client's labels() lookup
+        self._exec_children: Dict[Tuple[str, ...], Any] = {}
+        self._token_children: Dict[Tuple[str, ...], Any] = {}
+        self._tool_children: Dict[Tuple[str, ...], Any] = {}
+        
+        # In-memory storage for detailed metrics; each agent keeps its last
+        # 1000 records in a bounded deque that drops the oldest in O(1)
+        self.detailed_metrics: Dict[str, Deque[Dict[str, Any]]] = {}
+        
+        # Running totals over each agent's retained history, updated as
+        # records are added and evicted so reads need not rescan it
+        self.agent_stats: Dict[str, Dict[str, Any]] = {}
+        self._history_lock = threading.Lock()
     
     def record_agent_execution(
         self,
@@ -90,63 +155,134 @@ class MetricsCollector:
             tool_calls: Tool calls made during execution
         """
         # Record Prometheus metrics
-        self.agent_executions_total.labels(agent_id=agent_id, status=status).inc()
-        self.agent_execution_duration.labels(agent_id=agent_id).observe(duration)
+        self._child(self._exec_children, self.agent_executions_total, status).inc()
+        self.agent_execution_duration.observe(duration)
         
         if token_usage:
             for token_type, count in token_usage.items():
-                self.agent_token_usage.labels(
-                    agent_id=agent_id, 
-                    token_type=token_type
-                ).inc(count)
+                self._child(self._token_children, self.agent_token_usage, token_type).inc(count)
         
         if tool_calls:
-            for tool_call in tool_calls:
-                self.agent_tool_calls.labels(
-                    agent_id=agent_id,
-                    tool_name=tool_call.get('tool_name', 'unknown')
-                ).inc()
-        
-        # Store detailed metrics
-        if agent_id not in self.detailed_metrics:
-            self.detailed_metrics[agent_id] = []
-        
-        self.detailed_metrics[agent_id].append({
-            'timestamp': datetime.utcnow().isoformat(),
-            'status': status,
+            # One increment per distinct tool rather than per call
+            tool_counts = TallyCounter(tool_call.get('tool_name', 'unknown') for tool_call in tool_calls)
+            for tool_name, count in tool_counts.items():
+                self._child(self._tool_children, self.agent_tool_calls, tool_name).inc(count)
+        
+        # Store detailed metrics. Only the scalar fields the summaries read
+        # are kept, so records do not pin the callers' dicts and lists. The
+        # timestamp is kept as epoch seconds and only formatted when read.
+        record = {
+            '_ts': time.time(),
+            'status_code': _STATUS_CODES.get(status, _StatusCode.UNKNOWN),
             'duration': duration,
-            'token_usage': token_usage or {},
-            'tool_calls': tool_calls or []
-        })
-        
-        # Keep only last 1000 records per agent
-        if len(self.detailed_metrics[agent_id]) > 1000:
-            self.detailed_metrics[agent_id] = self.detailed_metrics[agent_id][-1000:]
-        
-        logger.info(
-            "Agent execution recorded",
-            agent_id=agent_id,
-            status=status,
-            duration=duration,
-            token_usage=token_usage,
-            tool_calls_count=len(tool_calls) if tool_calls else 0
-        )
+            'tokens': sum(token_usage.values()) if token_usage else 0
+        }
+        
+        with self._history_lock:
+            self._system_metrics_cache = None
+            executions = self.detailed_metrics.get(agent_id)
+            if executions is None:
+                executions = self.detailed_metrics[agent_id] = deque(maxlen=1000)
+                self.agent_stats[agent_id] = {
+                    'successful': 0,
+                    'failed': 0,
+                    'duration_sum': 0.0,
+                    'token_sum': 0
+                }
+            stats = self.agent_stats[agent_id]
+            
+            # The deque drops its oldest record; take it out of the totals
+            if len(executions) == executions.maxlen:
+                self._update_stats(stats, executions[0], -1)
+            executions.append(record)
+            self._update_stats(stats, record, 1)
+        
+        # Skip building the event dict when INFO is filtered out
+        if _level_logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Agent execution recorded",
+                agent_id=agent_id,
+                status=status,
+                duration=duration,
+                token_usage=token_usage,
+                tool_calls_count=len(tool_calls) if tool_calls else 0
+            )
+    
+    @staticmethod
+    def _child(cache: Dict[Tuple[str, ...], Any], metric: Any, *labelvalues: str) -> Any:
+        """Get a metric's child for the label values, resolving it once."""
+        child = cache.get(labelvalues)
+        if child is None:
+            child = cache[labelvalues] = metric.labels(*labelvalues)
+        return child
     
-    def record_error(self, error_type: str, error_details: str):
+    @staticmethod
+    def _update_stats(stats: Dict[str, Any], record: Dict[str, Any], sign: int):
+        """Add (sign=1) or remove (sign=-1) a record from running totals."""
+        status_code = record['status_code']
+        if status_code == _StatusCode.COMPLETED:
+            stats['successful'] += sign
+        elif status_code == _StatusCode.FAILED:
+            stats['failed'] += sign
+        stats['duration_sum'] += sign * record['duration']
+        stats['token_sum'] += sign * record['tokens']
+    
+    def record_error(self, error_type: str, error_details: Any = None):
         """Record system error.
         
+        Only ``error_type`` is used as a metric label, so callers must pass
+        one of a fixed set of names; the details go to the log only.
+        
         Args:
-            error_type: Type of error
-            error_details: Error details
+            error_type: Stable error category, used as the metric label
+            error_details: Exception or message describing the error
         """
         self.system_errors.labels(error_type=error_type).inc()
         
+        if not _level_logger.isEnabledFor(logging.ERROR):
+            return
+        
+        error_class = None
+        if isinstance(error_details, BaseException):
+            error_class = type(error_details).__name__
+            error_details = str(error_details)
+        
         logger.error(
             "System error recorded",
             error_type=error_type,
+            error_class=error_class,
             error_details=error_details
         )
     
+    def record_cache_hit(self, tool_name: str):
+        """Record a tool result served from cache.
+        
+        Args:
+            tool_name: Name of the tool
+        """
+        self.tool_cache_requests.labels(tool_name=tool_name, result='hit').inc()
+    
+    def record_cache_miss(self, tool_name: str):
+        """Record a tool result that had to be computed.
+        
+        Args:
+            tool_name: Name of the tool
+        """
+        self.tool_cache_requests.labels(tool_name=tool_name, result='miss').inc()
+    
+    def reset_agent(self, agent_id: str):
+        """Forget an agent's execution history and running totals.
+        
+        Prometheus counters are cumulative and are left unchanged.
+        
+        Args:
+            agent_id: Agent ID
+        """
+        with self._history_lock:
+            self.detailed_metrics.pop(agent_id, None)
+            self.agent_stats.pop(agent_id, None)
+            self._system_metrics_cache = None
+    
     def update_active_agents(self, count: int):
         """Update active agents count.
         
@@ -172,29 +308,32 @@ class MetricsCollector:
         Returns:
             Agent metrics summary
         """
-        if agent_id not in self.detailed_metrics:
-            return {}
-        
-        executions = self.detailed_metrics[agent_id]
-        
-        # Calculate summary statistics
-        total_executions = len(executions)
-        successful_executions = len([e for e in executions if e['status'] == 'completed'])
-        failed_executions = len([e for e in executions if e['status'] == 'failed'])
-        
-        durations = [e['duration'] for e in executions]
-        avg_duration = sum(durations) / len(durations) if durations else 0
-        
-        total_tokens = sum(
-            sum(e['token_usage'].values()) for e in executions
-        )
-        
-        # Last 7 days executions
-        seven_days_ago = datetime.utcnow() - timedelta(days=7)
-        recent_executions = [
-            e for e in executions
-            if datetime.fromisoformat(e['timestamp']) > seven_days_ago
-        ]
+        seven_days_ago = time.time() - 7 * 86400
+        
+        with self._history_lock:
+            executions = self.detailed_metrics.get(agent_id)
+            if executions is None:
+                return {}
+            stats = self.agent_stats[agent_id]
+            total_executions = len(executions)
+            successful_executions = stats['successful']
+            failed_executions = stats['failed']
+            duration_sum = stats['duration_sum']
+            total_tokens = stats['token_sum']
+            last_ts = executions[-1]['_ts'] if executions else None
+            
+            # History is in chronological order and the cap keeps it short,
+            # so older-than-a-week records are usually few or none. Count
+            # those from the oldest end and subtract.
+            stale_executions = 0
+            for e in executions:
+                if e['_ts'] > seven_days_ago:
+                    break
+                stale_executions += 1
+            recent_executions = total_executions - stale_executions
+        
+        avg_duration = duration_sum / total_executions if total_executions else 0
+        last_execution = datetime.utcfromtimestamp(last_ts).isoformat() if last_ts is not None else None
         
         return {
             'agent_id': agent_id,
@@ -204,25 +343,65 @@ class MetricsCollector:
             'success_rate': successful_executions / total_executions if total_executions > 0 else 0,
             'average_duration': avg_duration,
             'total_tokens': total_tokens,
-            'last_7_days_executions': len(recent_executions),
-            'last_execution': executions[-1]['timestamp'] if executions else None
+            'last_7_days_executions': recent_executions,
+            'last_execution': last_execution
         }
     
     def get_system_metrics(self) -> Dict[str, Any]:
         """Get system-wide metrics summary.
         
+        The summary is cached for ``system_metrics_ttl`` seconds and
+        invalidated whenever a new execution is recorded.
+        
         Returns:
             System metrics summary
         """
-        total_agents = len(self.detailed_metrics)
-        total_executions = sum(len(executions) for executions in self.detailed_metrics.values())
+        cached = self._system_metrics_cache
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+        
+        with self._system_metrics_lock:
+            cached = self._system_metrics_cache
+            if cached is not None and cached[1] > time.monotonic():
+                return cached[0]
+            metrics = self._compute_system_metrics()
+            self._system_metrics_cache = (metrics, time.monotonic() + self.system_metrics_ttl)
+            return metrics
+    
+    def get_system_metrics_json(self) -> bytes:
+        """Get the system-wide metrics summary as JSON.
         
-        all_executions = []
-        for executions in self.detailed_metrics.values():
-            all_executions.extend(executions)
+        The encoding is reused for as long as the cached summary is.
         
-        successful_executions = len([e for e in all_executions if e['status'] == 'completed'])
-        failed_executions = len([e for e in all_executions if e['status'] == 'failed'])
+        Returns:
+            JSON-encoded system metrics summary
+        """
+        metrics = self.get_system_metrics()
+        cached = self._system_metrics_json
+        if cached is not None and cached[0] is metrics:
+            return cached[1]
+        encoded = orjson.dumps(metrics)
+        self._system_metrics_json = (metrics, encoded)
+        return encoded
+    
+    def _compute_system_metrics(self) -> Dict[str, Any]:
+        """Compute the system-wide metrics summary.
+        
+        Returns:
+            System metrics summary
+        """
+        total_executions = 0
+        successful_executions = 0
+        failed_executions = 0
+        
+        # Sum the per-agent running totals rather than walking every record
+        with self._history_lock:
+            total_agents = len(self.detailed_metrics)
+            for agent_id, executions in self.detailed_metrics.items():
+                stats = self.agent_stats[agent_id]
+                total_executions += len(executions)
+                successful_executions += stats['successful']
+                failed_executions += stats['failed']
         
         return {
             'total_agents': total_agents,
@@ -239,12 +418,54 @@ class MetricsCollector:
         Returns:
             Prometheus metrics as string
         """
-        return generate_latest(self.registry).decode('utf-8')
+        return self.export_prometheus_bytes().decode('utf-8')
+    
+    def export_prometheus_bytes(self) -> bytes:
+        """Export metrics in Prometheus format, already encoded.
+        
+        Scrape intervals are much longer than ``prometheus_ttl``, so the
+        encoded export is reused for that many seconds.
+        
+        Returns:
+            Prometheus metrics as UTF-8 bytes
+        """
+        cached = self._prometheus_cache
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+        
+        with self._prometheus_lock:
+            cached = self._prometheus_cache
+            if cached is not None and cached[1] > time.monotonic():
+                return cached[0]
+            return self._generate_prometheus_export()
+    
+    def refresh_prometheus_export(self) -> bytes:
+        """Regenerate the cached Prometheus export.
+        
+        Called periodically in the background so scrapes are served from
+        the cache instead of walking the registry themselves.
+        
+        Returns:
+            Prometheus metrics as UTF-8 bytes
+        """
+        with self._prometheus_lock:
+            return self._generate_prometheus_export()
+    
+    def _generate_prometheus_export(self) -> bytes:
+        """Encode the registry and cache it; caller holds the lock."""
+        from prometheus_client import generate_latest
+        
+        output = generate_latest(self.registry)
+        self._prometheus_cache = (output, time.monotonic() + self.prometheus_ttl)
+        return output
 
 
 class PerformanceMonitor:
     """Performance monitoring context manager."""
     
+    # One monitor is created per execution, so skip the per-instance dict
+    __slots__ = ('metrics_collector', 'agent_id', 'start_time', 'status', 'token_usage', 'tool_calls')
+    
     def __init__(self, metrics_collector: MetricsCollector, agent_id: str):
         """Initialize performance monitor.
         
@@ -256,12 +477,13 @@ class PerformanceMonitor:
         self.agent_id = agent_id
         self.start_time = None
         self.status = "unknown"
-        self.token_usage = {}
-        self.tool_calls = []
+        # Allocated on first use; most executions report neither
+        self.token_usage: Optional[Dict[str, int]] = None
+        self.tool_calls: Optional[List[Dict[str, Any]]] = None
     
     def __enter__(self):
         """Start monitoring."""
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -269,13 +491,15 @@ class PerformanceMonitor:
         if self.start_time is None:
             return
         
-        duration = time.time() - self.start_time
+        duration = time.perf_counter() - self.start_time
         
         if exc_type is not None:
             self.status = "failed"
+            # Exception class names are open-ended, so they go to the log
+            # rather than into the metric label
             self.metrics_collector.record_error(
-                error_type=exc_type.__name__,
-                error_details=str(exc_val)
+                error_type="agent_execution_exception",
+                error_details=exc_val
             )
         elif self.status == "unknown":
             self.status = "completed"
@@ -302,8 +526,11 @@ class PerformanceMonitor:
         Args:
             token_usage: Token usage statistics
         """
+        totals = self.token_usage
+        if totals is None:
+            totals = self.token_usage = {}
         for token_type, count in token_usage.items():
-            self.token_usage[token_type] = self.token_usage.get(token_type, 0) + count
+            totals[token_type] = totals.get(token_type, 0) + count
     
     def add_tool_call(self, tool_call: Dict[str, Any]):
         """Add tool call information.
@@ -311,8 +538,24 @@ class PerformanceMonitor:
         Args:
             tool_call: Tool call details
         """
+        if self.tool_calls is None:
+            self.tool_calls = []
         self.tool_calls.append(tool_call)
 
 
-# Global metrics collector instance
-metrics_collector = MetricsCollector() 
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_metrics_collector() -> MetricsCollector:
+    """Get the global metrics collector, creating it on first use.
+    
+    Returns:
+        Shared metrics collector instance
+    """
+    return MetricsCollector()
+
+
+def __getattr__(name: str) -> Any:
+    # ``metrics_collector`` is resolved lazily through get_metrics_collector
+    if name == "metrics_collector":
+        return get_metrics_collector()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+ 
\ No newline at end of file
@@ -110,10 +110,12 @@ async def test_monitoring():
     print("\n5. Testing monitoring system...")
     
     try:
-        from src.monitoring import MetricsCollector, PerformanceMonitor
+        from src.monitoring import get_metrics_collector
         
-        # Test metrics collector
-        collector = MetricsCollector()
+        # Test the shared metrics collector, starting from an empty history
+        # for the test agent
+        collector = get_metrics_collector()
+        collector.reset_agent("test-agent")
         collector.record_agent_execution(
             agent_id="test-agent",
             status="completed",
@@ -151,13 +153,11 @@ async def main():
     ]
     
     results = []
-    for test in tests:
-        try:
-            result = await test()
-            results.append(result)
-        except Exception as e:
-            print(f"Test failed with exception: {e}")
-            results.append(False)
+    for result in await asyncio.gather(*(test() for test in tests), return_exceptions=True):
+        if isinstance(result, Exception):
+            print(f"Test failed with exception: {result}")
+            result = False
+        results.append(result)
     
     print("\n" + "=" * 60)
     print("TEST SUMMARY")
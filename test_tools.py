@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""Tests for the built-in tools and the tool manager."""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from src.core import ToolManager
+from src.core.tools import BuiltInTools, _ToolResultCache, _compile_expression
+
+
+def _builtin_tool(name: str):
+    """Create a built-in tool through the tool manager."""
+    tool_manager = ToolManager()
+    config = next(config for config in tool_manager.get_available_tools() if config.name == name)
+    return tool_manager.create_tool(config)
+
+
+def test_copy_file_tool_invoke():
+    """copy_file takes two arguments, so it must accept a dict input."""
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "source.txt")
+        destination = os.path.join(tmp, "nested", "copy.txt")
+        with open(source, "w") as f:
+            f.write("hello")
+        
+        copy_tool = _builtin_tool("copy_file")
+        result = copy_tool.invoke({"source_path": source, "destination_path": destination})
+        assert result.startswith("Successfully copied"), result
+        with open(destination) as f:
+            assert f.read() == "hello"
+        
+        # The async path runs the copy on the tool pool
+        destination = os.path.join(tmp, "async_copy.txt")
+        result = asyncio.run(copy_tool.ainvoke({"source_path": source, "destination_path": destination}))
+        assert result.startswith("Successfully copied"), result
+        assert os.path.exists(destination)
+
+
+def test_write_file_tool_invoke():
+    """write_file also takes two arguments through a structured schema."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "out.txt")
+        result = _builtin_tool("write_file").invoke({"file_path": path, "content": "data"})
+        assert result == f"Successfully wrote to {path}"
+        assert _builtin_tool("read_file").invoke(path) == "data"
+
+
+def test_read_file_cache_hit_and_invalidation():
+    """read_file results are reused until the file is rewritten."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "cached.txt")
+        with open(path, "w") as f:
+            f.write("aaaa")
+        st = os.stat(path)
+        
+        read_tool = _builtin_tool("read_file")
+        assert read_tool.invoke(path) == "aaaa"
+        
+        # Same inode, size and mtime: the cached result is served
+        with open(path, "r+") as f:
+            f.write("bbbb")
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert read_tool.invoke(path) == "aaaa"
+        
+        # Writing through the tools drops the cached entry, even if the
+        # rewrite keeps the size and mtime
+        _builtin_tool("write_file").invoke({"file_path": path, "content": "cccc"})
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert read_tool.invoke(path) == "cccc"
+        
+        # A change in size invalidates it without going through the tools
+        with open(path, "w") as f:
+            f.write("ddddd")
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert read_tool.invoke(path) == "ddddd"
+
+
+def test_tool_result_cache_ttl():
+    """Entries expire after the cache's TTL."""
+    cache = _ToolResultCache(maxsize=4, ttl=0.05)
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+    time.sleep(0.1)
+    assert cache.get("key") is None
+
+
+def test_execute_shell_command_blocks_dangerous_commands():
+    """Blocked names are rejected, including prefixed variants and paths."""
+    blocked = [
+        "rm -rf /tmp/x",
+        "/bin/rm file",
+        "rmdir some_dir",
+        "RM file",
+        "ls && sudo ls",
+        "su root",
+        "sudoedit /etc/hosts",
+        "chmod 777 file",
+        "chown user file",
+        "deluser someone",
+        "format c:",
+    ]
+    for command in blocked:
+        result = BuiltInTools.execute_shell_command(command)
+        assert result == "Error: Command not allowed for security reasons", command
+
+
+def test_execute_shell_command_allows_safe_commands():
+    """Commands that only contain a blocked name mid-word still run."""
+    for command, expected in [("echo hello", "hello"), ("echo farm", "farm"), ("pwd", os.getcwd())]:
+        result = BuiltInTools.execute_shell_command(command)
+        assert result.startswith("Exit code: 0"), result
+        assert expected in result, result
+
+
+def test_calculate_arithmetic():
+    """Unary and binary operators evaluate like Python arithmetic."""
+    cases = {
+        "2 + 3 * 4": "14",
+        "(2 + 3) * 4": "20",
+        "10 - 7": "3",
+        "7 / 2": "3.5",
+        "7 // 2": "3",
+        "2 ** 10": "1024",
+        "-3 + +5": "2",
+        "--4": "4",
+        "2 ** -2": "0.25",
+        "1.5 * 2": "3.0",
+    }
+    for expression, expected in cases.items():
+        assert BuiltInTools.calculate(expression) == expected, expression
+
+
+def test_calculate_rejects_non_arithmetic():
+    """Names, calls and attributes are rejected before evaluation."""
+    assert BuiltInTools.calculate("abs(1)") == "Error: Invalid characters in expression"
+    for expression in ["x + 1", "abs(1)", "(1).real", "[1, 2]", "1 < 2"]:
+        try:
+            _compile_expression(expression)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"{expression!r} was accepted")
+
+
+def test_calculate_limits():
+    """Large exponents and results that would grow too large are refused."""
+    assert BuiltInTools.calculate("2 ** 1001").startswith("Error: Exponents must be numeric literals")
+    assert BuiltInTools.calculate("2 ** (3 + 4)").startswith("Error: Exponents must be numeric literals")
+    assert BuiltInTools.calculate("((7 ** 1000) ** 1000) ** 100").startswith("Error: Result would exceed")
+    assert BuiltInTools.calculate("(2 ** 999) ** 999").startswith("Error: Result would exceed")
+    # Within the limits, large integers still work
+    assert BuiltInTools.calculate("2 ** 1000") == str(2 ** 1000)
+
+
+def test_calculate_division_by_zero():
+    """Division by zero is reported as an error result."""
+    for expression in ["1 / 0", "1 // 0", "2 ** -1 / 0"]:
+        result = BuiltInTools.calculate(expression)
+        assert result.startswith("Error:") and "by zero" in result, expression
+
+
+def main():
+    """Run all tests."""
+    tests = [value for name, value in globals().items() if name.startswith("test_") and callable(value)]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e!r}")
+    
+    print(f"\n{len(tests) - failed}/{len(tests)} tests passed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())